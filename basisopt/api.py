@@ -1,8 +1,16 @@
+import copy
+import hashlib
 import logging
 import os
-from typing import Any, Callable
+import pickle
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from importlib.util import find_spec
+from typing import Any, Callable, Iterator, Optional
 
 import colorlog
+import numpy as np
 
 from basisopt.exceptions import FailedCalculation
 from basisopt.molecule import Molecule
@@ -11,30 +19,128 @@ from basisopt.wrappers.wrapper import Wrapper
 
 bo_logger = logging.getLogger('basisopt')
 
-try:
-    import dask
-
-    from basisopt.parallelise import distribute
-
-    _PARALLEL = True
-except ImportError:
-    _PARALLEL = False
+# only check dask is available here, as importing it is slow
+_PARALLEL = find_spec("dask") is not None and find_spec("distributed") is not None
 
 _BACKENDS = {}
 _CURRENT_BACKEND = DummyWrapper()
 _TMP_DIR = "."
 
+"""Maximum number of results memoised by run_calculation, 0 if off; see set_result_cache"""
+_RESULT_CACHE_SIZE = 0
+_result_cache = OrderedDict()
+
+"""Path to an SQLite database that also stores memoised results, None if not used"""
+_RESULT_CACHE_FILE = None
+
+
+def set_result_cache(size: int = 1024, filename: Optional[str] = None):
+    """Turns memoisation of calculation results on or off. When on, a
+    calculation identical to a recent one (same backend, options, molecule,
+    basis and parameters, see calculation_key) is not rerun, and the stored
+    value is returned instead. Off by default.
+
+    Arguments:
+         size (int): maximum number of results to keep in memory, 0 to turn off
+         filename (str): if given, every result is also stored in an SQLite
+             database at this path, so results persist between runs of a script
+    """
+    global _RESULT_CACHE_SIZE, _RESULT_CACHE_FILE
+    _RESULT_CACHE_SIZE = max(size, 0)
+    _RESULT_CACHE_FILE = filename
+    _result_cache.clear()
+
+
+def clear_result_cache():
+    """Removes all memoised results, including any stored on disk"""
+    _result_cache.clear()
+    if _RESULT_CACHE_FILE is not None:
+        with closing(_connect_result_store()) as conn, conn:
+            conn.execute("DELETE FROM results")
+
+
+def _connect_result_store() -> sqlite3.Connection:
+    """Opens the on-disk result cache, creating it if needed; a connection
+    is opened for each access, so that forked workers don't share one
+    """
+    conn = sqlite3.connect(_RESULT_CACHE_FILE, timeout=60)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, value BLOB)")
+    return conn
+
+
+def _cache_result(key: bytes, value: Any, store: bool = True):
+    """Adds a result to the in-memory cache, and to the disk cache if store is True"""
+    # keep a copy, so that changing an array result in place can't alter the cache
+    _result_cache[key] = copy.deepcopy(value)
+    if len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    if store and _RESULT_CACHE_FILE is not None:
+        with closing(_connect_result_store()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?)",
+                (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+
+
+def _lookup_result(key: bytes) -> tuple[bool, Any]:
+    """Looks for a memoised result, first in memory and then on disk
+
+    Returns:
+         (True, value) if found, otherwise (False, None); the value is a copy
+    """
+    if key in _result_cache:
+        _result_cache.move_to_end(key)
+        return True, copy.deepcopy(_result_cache[key])
+    if _RESULT_CACHE_FILE is not None:
+        with closing(_connect_result_store()) as conn:
+            row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            value = pickle.loads(row[0])
+            _cache_result(key, value, store=False)
+            return True, value
+    return False, None
+
+
+def _run(evaluate: str, mol: Molecule, params: dict[Any, Any]) -> int:
+    """Runs a calculation with the current backend, going through
+    the result cache if it is turned on
+    """
+    return _run_many([evaluate], mol, params)
+
+
+def _run_many(evaluates: list[str], mol: Molecule, params: dict[Any, Any]) -> int:
+    """Runs calculations of several properties with the current backend, going
+    through the result cache if it is turned on; results are memoised per property
+    """
+    to_run = evaluates
+    if _RESULT_CACHE_SIZE > 0:
+        keys = {e: calculation_key(mol, e, params) for e in evaluates}
+        to_run = []
+        for e, key in keys.items():
+            found, value = _lookup_result(key)
+            if found:
+                _CURRENT_BACKEND.set_value(e, value)
+            else:
+                to_run.append(e)
+        if len(to_run) == 0:
+            return 0
+
+    if len(to_run) == 1:
+        result = _CURRENT_BACKEND.run(to_run[0], mol, params, tmp=_TMP_DIR)
+    else:
+        result = _CURRENT_BACKEND.run_many(to_run, mol, params, tmp=_TMP_DIR)
+    if result == 0 and _RESULT_CACHE_SIZE > 0:
+        for e in to_run:
+            _cache_result(keys[e], _CURRENT_BACKEND.get_value(e))
+    return result
+
 
 def set_parallel(value: bool = True):
     """Turns parallelism on/off"""
     global _PARALLEL
     if value:
-        try:
-            import dask
-
-            _PARALLEL = True
-        except ImportError:
-            _PARALLEL = False
+        _PARALLEL = find_spec("dask") is not None and find_spec("distributed") is not None
+        if not _PARALLEL:
             bo_logger.warning("Could not import dask, parallelism turned off")
     else:
         _PARALLEL = False
@@ -149,6 +255,84 @@ def orca(path: str):
     bo_logger.info("ORCA install dir at: %s", path)
 
 
+@contextmanager
+def backend_session() -> Iterator[Wrapper]:
+    """Context manager that runs the enclosed calculations in a single
+    session of the current backend (see Wrapper.begin_session)
+    """
+    _CURRENT_BACKEND.begin_session()
+    try:
+        yield _CURRENT_BACKEND
+    finally:
+        _CURRENT_BACKEND.end_session()
+
+
+def _hash_value(h: Any, value: Any):
+    """Feeds a parameter value into the hash h, using the raw bytes of any
+    numpy arrays, as their repr elides the middle of large arrays
+    """
+    if isinstance(value, np.ndarray):
+        h.update(f"<{value.dtype.str}{value.shape}".encode())
+        h.update(np.ascontiguousarray(value).tobytes())
+        h.update(b">")
+    elif isinstance(value, dict):
+        h.update(b"{")
+        for k in sorted(value, key=repr):
+            _hash_value(h, k)
+            h.update(b":")
+            _hash_value(h, value[k])
+        h.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        h.update(b"(" if isinstance(value, tuple) else b"[")
+        for v in value:
+            _hash_value(h, v)
+            h.update(b",")
+        h.update(b")" if isinstance(value, tuple) else b"]")
+    else:
+        h.update(repr(value).encode())
+
+
+def calculation_key(mol: Molecule, evaluate: str, params: dict[Any, Any]) -> bytes:
+    """Hashes everything that determines the result of a calculation
+
+    Arguments:
+         mol (Molecule): molecule the calculation is run on
+         evaluate (str): property to evaluate
+         params (dict): parameters passed to the backend
+
+    Returns:
+         a digest identifying the calculation
+    """
+    h = hashlib.blake2b(digest_size=32)
+    header = (
+        _CURRENT_BACKEND._name,
+        evaluate,
+        mol.method,
+        mol.charge,
+        mol.multiplicity,
+        mol._atom_names,
+        sorted(mol.dummy_atoms),
+        mol.ecps,
+        params,
+        _CURRENT_BACKEND._globals,
+    )
+    _hash_value(h, header)
+    for c in mol._coords:
+        h.update(np.asarray(c, dtype=float).tobytes())
+    for basis in [mol.basis, mol.jbasis, mol.jkbasis]:
+        if not basis:
+            h.update(b"|")
+            continue
+        for el in sorted(basis.keys()):
+            h.update(f"|{el}".encode())
+            for shell in basis[el]:
+                h.update(f":{shell.l}{len(shell.exps)}.{len(shell.coefs)}".encode())
+                h.update(np.asarray(shell.exps, dtype=float).tobytes())
+                for c in shell.coefs:
+                    h.update(np.asarray(c, dtype=float).tobytes())
+    return h.digest()
+
+
 def run_calculation(
     evaluate: str = 'energy', mol: Molecule = None, params: dict[Any, Any] = {}
 ) -> int:
@@ -162,8 +346,30 @@ def run_calculation(
     Returns:
         int: 0 on success, non-zero on failure
     """
-    result = _CURRENT_BACKEND.run(evaluate, mol, params, tmp=_TMP_DIR)
-    _CURRENT_BACKEND.clean()
+    result = _run(evaluate, mol, params)
+    if not _CURRENT_BACKEND._session:
+        _CURRENT_BACKEND.clean()
+    return result
+
+
+def run_calculations(
+    evaluates: list[str] = ['energy'], mol: Molecule = None, params: dict[Any, Any] = {}
+) -> int:
+    """Interface to the wrapper used to calculate several properties of one
+    molecule, which some backends can do with a single calculation; see
+    run_calculation. Each value is retrieved with get_backend().get_value.
+
+    Arguments:
+        evaluates (list): the functions to be called for the computation
+        mol (Molecule): molecule to run the calculations on
+        params (dict): A dictionary of parameters needed for the computation
+
+    Returns:
+        int: 0 on success, non-zero on failure
+    """
+    result = _run_many(list(evaluates), mol, params)
+    if not _CURRENT_BACKEND._session:
+        _CURRENT_BACKEND.clean()
     return result
 
 
@@ -171,11 +377,12 @@ def _one_job(
     mol: Molecule, evaluate: str = 'energy', params: dict[Any, Any] = {}
 ) -> tuple[str, Any]:
     """Internal helper to run a single job in a distributed array"""
-    success = _CURRENT_BACKEND.run(evaluate, mol, params, tmp=_TMP_DIR)
+    success = _run(evaluate, mol, params)
     if success != 0:
         raise FailedCalculation
     value = _CURRENT_BACKEND.get_value(evaluate)
-    _CURRENT_BACKEND.clean()
+    if not _CURRENT_BACKEND._session:
+        _CURRENT_BACKEND.clean()
     return mol.name, value
 
 
@@ -184,6 +391,7 @@ def run_all(
     mols: list[Molecule] = [],
     params: dict[Any, Any] = {},
     parallel: bool = False,
+    n_proc: int = 3,
 ) -> dict[str, Any]:
     """Runs calculations over a set of molecules, optionally in parallel
 
@@ -192,17 +400,39 @@ def run_all(
          mols (list): a list of Molecule objects to run
          params (dict): parameters for backend
          parallel (bool): if True, will try to run distributed
+         n_proc (int): number of processes to run calculations on when parallel;
+             the total cores used is n_proc times those used by each calculation
 
     Returns:
          a dictionary  of the form {molecule name: value}
     """
     results = {}
     if parallel and _PARALLEL:
+        import dask
+
+        from basisopt.parallelise import distribute
+
+        # workers' result caches are lost when they exit, so memoised values
+        # are looked up, and new ones stored, in this process
+        keys = {}
+        to_run = []
+        for m in mols:
+            if _RESULT_CACHE_SIZE > 0:
+                key = calculation_key(m, evaluate, params)
+                found, value = _lookup_result(key)
+                if found:
+                    results[m.name] = value
+                    continue
+                keys[m.name] = key
+            to_run.append(m)
+
         kwargs = {"evaluate": evaluate, "params": params}
         with dask.config.set({"multiprocessing.context": "fork"}):
-            tmp_results = distribute(3, _one_job, mols, **kwargs)
+            tmp_results = distribute(n_proc, _one_job, to_run, **kwargs)
         for n, v in tmp_results:
             results[n] = v
+            if n in keys:
+                _cache_result(keys[n], v)
     else:
         for m in mols:
             name, value = _one_job(m, evaluate=evaluate, params=params)
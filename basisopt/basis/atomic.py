@@ -73,7 +73,7 @@ class AtomicBasis(Basis):
     def save(self, filename: str):
         """Pickles the AtomicBasis object into a binary file"""
         with open(filename, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
             f.close()
         bo_logger.info("Dumped object of type %s to %s", type(self), filename)
 
@@ -16,12 +16,7 @@ def uncontract_shell(shell: Shell):
     """Converts a Shell into an uncontracted Shell
     (overwrites any existing contraction coefs)
     """
-    shell.coefs = []
-    n = shell.exps.size
-    for ix in range(n):
-        c = np.zeros(n)
-        c[ix] = 1.0
-        shell.coefs.append(c)
+    shell.coefs = list(np.eye(shell.exps.size))
 
 
 def uncontract(basis: InternalBasis, elements: Optional[list[str]] = None) -> InternalBasis:
@@ -61,7 +56,7 @@ def even_temper_expansion(params: ETParams) -> list[Shell]:
     for ix, (c, x, n) in enumerate(params):
         new_shell = Shell()
         new_shell.l = data.INV_AM_DICT[ix]
-        new_shell.exps = np.array([c * (x**p) for p in range(n)])
+        new_shell.exps = c * np.power(float(x), np.arange(n))
         uncontract_shell(new_shell)
         el_basis.append(new_shell)
     return el_basis
@@ -72,10 +67,13 @@ def fix_ratio(exps: np.ndarray, ratio: float = 1.4) -> np.ndarray:
     where x_{i+1}/x_i >= ratio
     """
     new_exps = np.sort(exps)
-    for i in range(exps.size - 1):
-        if new_exps[i + 1] / new_exps[i] < ratio:
-            new_exps[i + 1] = new_exps[i] * ratio
-    return new_exps
+    # x_i must be at least x_j * ratio**(i-j) for all j < i, i.e. at least
+    # ratio**i * max_{j<=i}(x_j / ratio**j), which is a running maximum;
+    # exponents that are already far enough apart are kept exactly
+    powers = ratio ** np.arange(new_exps.size)
+    scaled = new_exps / powers
+    running = np.maximum.accumulate(scaled)
+    return np.where(running == scaled, new_exps, powers * running)
 
 
 class Basis(MSONable):
@@ -100,7 +98,7 @@ class Basis(MSONable):
     def save(self, filename: str):
         """Pickles the Basis object into a binary file"""
         with open(filename, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
             f.close()
         bo_logger.info("Dumped object of type %s to %s", type(self), filename)
 
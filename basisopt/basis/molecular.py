@@ -16,6 +16,7 @@ from basisopt.exceptions import DataNotFound, EmptyBasis
 from basisopt.molecule import Molecule
 from basisopt.opt.optimizers import collective_optimize
 from basisopt.opt.strategies import Strategy
+from basisopt.testing import Test
 from basisopt.util import bo_logger
 
 from .atomic import AtomicBasis
@@ -51,7 +52,7 @@ class MolecularBasis(Basis):
     def save(self, filename: str):
         """Pickles the MolecularBasis object into a binary file"""
         with open(filename, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
             f.close()
         bo_logger.info("Dumped object of type %s to %s", type(self), filename)
 
@@ -117,6 +118,70 @@ class MolecularBasis(Basis):
         """Returns a list of all the Molecule objects"""
         return list(self._molecules.values())
 
+    def _calculate_test(
+        self,
+        t: Test,
+        params: dict[str, Any] = {},
+        reference_basis: Optional[Union[str, InternalBasis]] = None,
+        with_reference: bool = False,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Runs the calculations for a single test across all molecules,
+        without storing anything in self.results
+
+        Arguments:
+             t (Test): the test to calculate
+             params (dict): parameters for backend
+             reference_basis (str or dict): see run_test
+             with_reference (bool): if True, reference values are calculated first
+
+        Returns:
+             two dictionaries, of reference values and of results, indexed by
+             molecule name; the first is empty if with_reference is False
+        """
+        references = {}
+        if with_reference:
+            bo_logger.info("Calculating reference values for test %s", t.name)
+            str_basis = isinstance(reference_basis, str)
+            for m in self.molecules():
+                t.molecule = m
+                if str_basis:
+                    t.calculate_reference(m.method, basis_name=reference_basis, params=params)
+                else:
+                    t.calculate_reference(m.method, basis=reference_basis, params=params)
+                references[m.name] = t.reference
+
+        results = {}
+        for m in self.molecules():
+            t.result = t.calculate(m.method, self.basis, params=params)
+            results[m.name] = t.result
+        return references, results
+
+    def _test_result(self, name: str) -> tuple[Result, bool]:
+        """Returns the child Result for a test, creating it if needed,
+        and whether it was newly created
+        """
+        try:
+            return self.results.get_child(name), False
+        except DataNotFound:
+            child = Result(name=name)
+            self.results.add_child(child)
+            return child, True
+
+    def _store_test(
+        self,
+        child: Result,
+        references: dict[str, Any],
+        results: dict[str, Any],
+        do_print: bool = True,
+    ):
+        """Adds the reference values and results of a test to its Result"""
+        for k, v in references.items():
+            child.add_data(f"{k}_ref", v)
+        for k, v in results.items():
+            child.add_data(k, v)
+            if do_print:
+                bo_logger.info("%s: %s", k, str(v))
+
     def run_test(
         self,
         name: str,
@@ -141,36 +206,19 @@ class MolecularBasis(Basis):
         if t is None:
             bo_logger.warning("No test with name %s", name)
         else:
-            try:
-                child = self.results.get_child(name)
-            except DataNotFound:
-                new_result = Result(name=name)
-                self.results.add_child(new_result)
-                child = new_result
-
-                # calculate reference values
-                bo_logger.info("Calculating reference values for test %s", name)
-                str_basis = isinstance(reference_basis, str)
-                for m in self.molecules():
-                    t.molecule = m
-                    if str_basis:
-                        t.calculate_reference(m.method, basis_name=reference_basis, params=params)
-                    else:
-                        t.calculate_reference(m.method, basis=reference_basis, params=params)
-                    child.add_data(f"{m.name}_ref", t.reference)
-
-            for m in self.molecules():
-                t.result = t.calculate(m.method, self.basis, params=params)
-                child.add_data(m.name, t.result)
-                results[m.name] = t.result
-                if do_print:
-                    bo_logger.info("%s: %s", m.name, str(t.result))
+            child, new = self._test_result(name)
+            references, results = self._calculate_test(
+                t, params=params, reference_basis=reference_basis, with_reference=new
+            )
+            self._store_test(child, references, results, do_print=do_print)
         return results
 
     def run_all_tests(
         self,
         params: dict[str, Any] = {},
         reference_basis: Optional[Union[str, InternalBasis]] = None,
+        parallel: bool = False,
+        n_proc: int = 3,
     ) -> None:
         """Runs all of the tests across all molecules, and prints the results to logger
 
@@ -178,12 +226,42 @@ class MolecularBasis(Basis):
              params (dict): paramerters to pass to the backend
              reference_basis (str or dict): either string name for basis to fetch
                  from the BSE, or an internal basis dictionary, or None
+             parallel (bool): if True, the tests are distributed over processes,
+                 one test per process, as in api.run_all
+             n_proc (int): number of processes to run tests on when parallel;
+                 the total cores used is n_proc times those used by each calculation
         """
         results = {}
-        for t in self._tests:
-            results[t.name] = self.run_test(
-                t.name, params=params, reference_basis=reference_basis, do_print=False
-            )
+        if parallel and api._PARALLEL and len(self._tests) > 1:
+            import dask
+
+            from basisopt.parallelise import distribute
+
+            children = {t.name: self._test_result(t.name) for t in self._tests}
+            kwargs = {
+                "basis": self,
+                "params": params,
+                "reference_basis": reference_basis,
+                "new_tests": frozenset(k for k, (_, new) in children.items() if new),
+            }
+            with dask.config.set({"multiprocessing.context": "fork"}):
+                tmp_results = distribute(n_proc, _test_job, list(children), **kwargs)
+            mols = self.molecules()
+            for name, references, values in tmp_results:
+                self._store_test(children[name][0], references, values, do_print=False)
+                results[name] = values
+                # leave each test as it would be after running in this process
+                t = self.get_test(name)
+                if references:
+                    t.molecule = mols[-1]
+                    t.reference = references[mols[-1].name]
+                if values:
+                    t.result = values[mols[-1].name]
+        else:
+            for t in self._tests:
+                results[t.name] = self.run_test(
+                    t.name, params=params, reference_basis=reference_basis, do_print=False
+                )
         # print results
         header = "Molecule"
         for t in self._tests:
@@ -286,3 +364,18 @@ class MolecularBasis(Basis):
             bo_logger.error("Please call setup first")
             self.opt_results = None
         return self.opt_results
+
+
+def _test_job(
+    name: str,
+    basis: Optional[MolecularBasis] = None,
+    params: dict[str, Any] = {},
+    reference_basis: Optional[Union[str, InternalBasis]] = None,
+    new_tests: frozenset[str] = frozenset(),
+) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """Internal helper to run a single test of a MolecularBasis in a distributed array"""
+    t = basis.get_test(name)
+    references, results = basis._calculate_test(
+        t, params=params, reference_basis=reference_basis, with_reference=name in new_tests
+    )
+    return name, references, results
@@ -1,13 +1,22 @@
 # wrappers for BasisSetExchange functionality
-
+import hashlib
+from collections import OrderedDict
 from typing import Any
 
-import basis_set_exchange as bse
 import numpy as np
 
 import basisopt.data as data
 from basisopt.containers import BSEBasis, InternalBasis, Shell
 
+# basis_set_exchange is imported where it is used, as it is slow to load and
+# only needed once a basis is fetched or written out
+
+"""Maximum number of formatted basis strings kept in _converter_cache"""
+_CONVERTER_CACHE_SIZE = 64
+
+"""LRU cache of internal_basis_converter output, keyed by (basis_fingerprint, fmt)"""
+_converter_cache = OrderedDict()
+
 
 def make_bse_shell(shell: Shell) -> dict[str, Any]:
     """Converts an internal-format basis shell into a BSE-format shell
@@ -55,6 +64,8 @@ def internal_to_bse(basis: InternalBasis) -> BSEBasis:
     Returns:
          a BSE basis of type 'component' with 'gto_spherical' function types
     """
+    import basis_set_exchange as bse
+
     # get a container
     bse_basis = bse.skel.create_skel('component')
     bse_basis['function_types'] = ['gto_spherical']
@@ -81,6 +92,8 @@ def bse_to_internal(basis: BSEBasis) -> InternalBasis:
     Returns:
          an internal basis dictionary
     """
+    import basis_set_exchange as bse
+
     new_basis = {}
     for z, e in basis['elements'].items():
         shells = {}
@@ -106,6 +119,21 @@ def bse_to_internal(basis: BSEBasis) -> InternalBasis:
     return new_basis
 
 
+def basis_fingerprint(basis: InternalBasis) -> bytes:
+    """Returns a digest of the elements, angular momenta, exponents
+    and coefficients in an internal basis
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for el, shells in basis.items():
+        h.update(f"|{el}".encode())
+        for shell in shells:
+            h.update(f":{shell.l}{len(shell.exps)}.{len(shell.coefs)}".encode())
+            h.update(np.asarray(shell.exps, dtype=float).tobytes())
+            for c in shell.coefs:
+                h.update(np.asarray(c, dtype=float).tobytes())
+    return h.digest()
+
+
 def internal_basis_converter(basis: InternalBasis, fmt: str = 'gaussian94') -> str:
     """Writes out an internal basis in the desired BSE format
 
@@ -116,8 +144,19 @@ def internal_basis_converter(basis: InternalBasis, fmt: str = 'gaussian94') -> s
     Returns:
          the basis as a string in the desired format
     """
+    import basis_set_exchange as bse
+
+    key = (basis_fingerprint(basis), fmt)
+    if key in _converter_cache:
+        _converter_cache.move_to_end(key)
+        return _converter_cache[key]
+
     bse_basis = internal_to_bse(basis)
-    return bse.writers.write_formatted_basis_str(bse_basis, fmt)
+    basis_str = bse.writers.write_formatted_basis_str(bse_basis, fmt)
+    _converter_cache[key] = basis_str
+    if len(_converter_cache) > _CONVERTER_CACHE_SIZE:
+        _converter_cache.popitem(last=False)
+    return basis_str
 
 
 def fetch_basis(name: str, elements: list[str]) -> InternalBasis:
@@ -130,6 +169,8 @@ def fetch_basis(name: str, elements: list[str]) -> InternalBasis:
     Returns:
          an internal basis dictionary
     """
+    import basis_set_exchange as bse
+
     basis = bse.get_basis(name, elements)
     return bse_to_internal(basis)
 
@@ -145,6 +186,8 @@ def fetch_ecp(name: str, elements: list[str]) -> BSEBasis:
     Returns:
          a BSE basis dictionary
     """
+    import basis_set_exchange as bse
+
     basis = bse.get_basis(name, elements)
     for el, elbas in basis['elements'].items():
         assert 'ecp_potentials' in elbas, f"Element {el} does not have an ECP in {name}"
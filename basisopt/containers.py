@@ -1,16 +1,19 @@
 # containers
 import pickle
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from monty.json import MSONable
-from scipy.optimize import OptimizeResult
 from scipy.special import sph_harm
 
 from . import data
 from .exceptions import DataNotFound, InvalidResult
 from .util import bo_logger, dict_decode
 
+if TYPE_CHECKING:
+    # only needed for annotations; scipy.optimize is slow to import
+    from scipy.optimize import OptimizeResult  # noqa: F401
+
 
 class Shell(MSONable):
     """Lightweight container for basis set Shells.
@@ -63,12 +66,14 @@ class Shell(MSONable):
         """Computes the value of the (spherical) GTO at a given point
 
         Arguments:
-            x, y, z (float): coordinates relative to center of GTO
+            x, y, z (float or np.ndarray): coordinates relative to center of GTO;
+                arrays of points are evaluated together
             i (int): index of GTO in coefs
             m (int): azimuthal quantum number in [-l, l]
 
         Returns:
-            The unnormalised value of the GTO at (x, y, z)
+            The unnormalised value of the GTO at (x, y, z), an array of
+            values if given arrays of coordinates
         """
         # bounds checking
         lval = data.AM_DICT[self.l]
@@ -84,15 +89,58 @@ class Shell(MSONable):
         phi = np.arctan2(y, x)
 
         # Compute radial value
-        radial_part = 0.0
-        for al, c in zip(self.exps, self.coefs[i]):
-            radial_part += c * np.exp(-al * r2)
+        radial_part = np.exp(-np.multiply.outer(r2, self.exps)) @ np.asarray(self.coefs[i])
         radial_part *= r ** (lval)
 
         # Combine with angular value
         angular_part = np.real(sph_harm(m, lval, theta, phi))
         return radial_part * angular_part
 
+    @staticmethod
+    def compute_batch(
+        shells: list['Shell'], x: np.ndarray, y: np.ndarray, z: np.ndarray, i: int = 0, m: int = 0
+    ) -> np.ndarray:
+        """Computes the values of several (spherical) GTOs at a set of points at
+        once, see compute. The primitives of all the shells are padded to the same
+        length and stacked, so the radial parts are a single batched contraction.
+
+        Arguments:
+            shells (list): Shell objects to evaluate
+            x, y, z (np.ndarray): coordinates of the points relative to the centre
+            i (int): index of GTO in coefs, 0 for any shell with fewer contractions
+            m (int): azimuthal quantum number, clipped to [-l, l] for each shell
+
+        Returns:
+            (nshells, npoints) array of the unnormalised values of each GTO
+        """
+        x, y, z = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (x, y, z))
+        nprim = max((s.exps.size for s in shells), default=0)
+        exps = np.zeros((len(shells), nprim))
+        coefs = np.zeros((len(shells), nprim))
+        lvals = np.empty(len(shells), dtype=int)
+        for ix, s in enumerate(shells):
+            n = s.exps.size
+            exps[ix, :n] = s.exps
+            coefs[ix, :n] = s.coefs[i if i < len(s.coefs) else 0]
+            lvals[ix] = data.AM_DICT[s.l]
+        mvals = np.sign(m) * np.minimum(abs(m), lvals)
+
+        # Convert to spherical coords
+        r2 = x * x + y * y
+        theta = np.arctan2(z, r2)
+        r2 += z * z
+        r = np.sqrt(r2)
+        phi = np.arctan2(y, x)
+
+        # Compute radial values for every shell and point together;
+        # padded primitives have zero coefficients so don't contribute
+        radial_part = np.einsum('sp,spq->sq', coefs, np.exp(-exps[:, :, None] * r2))
+        radial_part *= r ** lvals[:, None]
+
+        # Combine with angular values
+        angular_part = np.real(sph_harm(mvals[:, None], lvals[:, None], theta, phi))
+        return radial_part * angular_part
+
 
 InternalBasis = dict[str, list[Shell]]
 BSEBasis = dict[str, Any]
@@ -130,7 +178,7 @@ def dict_to_basis(d: dict[str, Any]) -> InternalBasis:
     return d
 
 
-OptResult = dict[str, OptimizeResult]
+OptResult = dict[str, 'OptimizeResult']
 OptCollection = dict[str, OptResult]
 
 
@@ -223,9 +271,12 @@ class Result(MSONable):
     @depth.setter
     def depth(self, value: int):
         self._depth = value
-        # Need to update all children too
-        for c in self._children:
-            c.depth = value + 1
+        # Need to update all descendants too
+        stack = [(c, value + 1) for c in self._children]
+        while stack:
+            node, node_depth = stack.pop()
+            node._depth = node_depth
+            stack.extend((c, node_depth + 1) for c in node._children)
 
     def add_data(self, name: str, value: Any):
         """Adds a data point to the result, with archiving
@@ -258,13 +309,12 @@ class Result(MSONable):
         Raises:
              DataNotFound if the requested data doesn't exist
         """
-        if name not in self._data_keys:
+        count = self._data_keys.get(name)
+        if count is None:
             # Have to raise an exception as we cannot surmise data type
             raise DataNotFound
-        else:
-            index = self._data_keys[name] - step_back
-            index = max(1, index)
-            return self._data_values[name + str(index)]
+        index = max(1, count - step_back)
+        return self._data_values[f"{name}{index}"]
 
     def add_child(self, child: object):
         """Adds a child Result to this Result"""
@@ -287,22 +337,25 @@ class Result(MSONable):
         the name and which child it was found in
         """
         results = {}
-        if name in self._data_keys:
-            for n in range(self._data_keys[name]):
-                resname = f"{name}{n+1}"
-                results[self.name + "_" + resname] = self._data_values[resname]
-        for c in self._children:
-            tmp = c.search(name)
-            for k, v in tmp.items():
-                results[k] = v
+        # walk the tree depth-first with an explicit stack, so deep trees
+        # don't hit the recursion limit; children are pushed in reverse
+        # so they are visited in order
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if name in node._data_keys:
+                for n in range(node._data_keys[name]):
+                    resname = f"{name}{n+1}"
+                    results[node.name + "_" + resname] = node._data_values[resname]
+            stack.extend(reversed(node._children))
         return results
 
     def save(self, filename: str):
         """Pickles the Result object into a file"""
         with open(filename, 'wb') as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
             f.close()
-        bo_logger.info("Dumped object of type %s to %s", type(data), filename)
+        bo_logger.info("Dumped object of type %s to %s", type(self), filename)
 
     def load(self, filename: str) -> object:
         """Loads and returns a Result object from a file pickle"""
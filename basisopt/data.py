@@ -2,7 +2,6 @@
 from functools import cache
 
 import numpy as np
-from mendeleev import element as md_element
 
 # Conversion factors
 TO_CM = 219474.63067
@@ -14,6 +13,9 @@ FORCE_MASS = 1822.88853
 
 @cache
 def atomic_number(element: str) -> int:
+    # mendeleev is slow to import, so only load it when first needed
+    from mendeleev import element as md_element
+
     el = md_element(element)
     return el.atomic_number
 
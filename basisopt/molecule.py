@@ -1,4 +1,8 @@
 # molecule
+import copy
+import functools
+import os
+import sys
 from typing import Any
 
 import numpy as np
@@ -10,6 +14,31 @@ from .exceptions import InvalidDiatomic
 from .util import bo_logger, dict_decode
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_xyz(
+    filename: str, mtime: float
+) -> tuple[tuple[str, ...], tuple[tuple[float, ...], ...]]:
+    """Reads the element names and coordinates from an xyz file; cached, keyed
+    on the modification time so that edited files are read again
+
+    Returns:
+         a tuple of element names, and a tuple of (x, y, z) coordinates
+    """
+    # Read in xyz file
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+    # parse
+    # first line should be natoms
+    nat = int(lines[0])
+    # second line is title
+    elements, coords = [], []
+    for line in lines[2 : 2 + nat]:
+        words = line.split()
+        elements.append(words[0])
+        coords.append(tuple(float(w) for w in words[1:4]))
+    return tuple(elements), tuple(coords)
+
+
 class Molecule(MSONable):
     """A very loose definition of a molecule, in that it represents
     an object with which calculations can be done.
@@ -27,7 +56,8 @@ class Molecule(MSONable):
          dummy_atoms (list): list of indices of atoms that should be treated as dummies
 
     Private attributes:
-         _atom_names (list): atom symbols in order, e.g. ['H', 'H', 'O']
+         _atom_names (list): atom symbols in order, e.g. ['H', 'H', 'O'], interned so
+             that molecules share one string per element
          _coords (list): x,y,z coords in Angstrom, as numpy arrays, same
          order as _atom_names
          _results (dict): dictionary of results calculated for this molecule.
@@ -69,10 +99,23 @@ class Molecule(MSONable):
              dummy (bool): if True, the atom is marked as a dummy atom
         """
         self._coords.append(np.array(coord))
-        self._atom_names.append(element)
+        self._atom_names.append(sys.intern(element))
         if dummy:
             self.dummy_atoms.append(len(self._atom_names) - 1)
 
+    def add_atoms_bulk(self, elements: list[str], coords: np.ndarray):
+        """Adds several atoms to the molecule in one go
+
+        Arguments:
+             elements (list): element names, one per atom
+             coords (numpy array): (N, 3) array of x,y,z coords in Angstrom
+        """
+        coords = np.array(coords, dtype=float).reshape(-1, 3)
+        if len(elements) != coords.shape[0]:
+            raise ValueError("Number of elements and coordinates do not match")
+        self._coords.extend(coords)
+        self._atom_names.extend(sys.intern(e) for e in elements)
+
     def add_result(self, name: str, value: Any):
         """Store a result (no archiving)
 
@@ -120,18 +163,8 @@ class Molecule(MSONable):
         """
         instance = cls(name=name, charge=charge, mult=mult)
         try:
-            # Read in xyz file
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-            # parse
-            # first line should be natoms
-            nat = int(lines[0])
-            # second line is title
-            for line in lines[2 : 2 + nat]:
-                words = line.split()
-                element = words[0]
-                coords = np.array([float(w) for w in words[1:4]])
-                instance.add_atom(element=element, coord=coords)
+            elements, coords = _parse_xyz(filename, os.path.getmtime(filename))
+            instance.add_atoms_bulk(list(elements), coords)
         except IOError as e:
             bo_logger.error("I/O error(%d): %s", e.errno, e.strerror)
         except Exception:
@@ -144,10 +177,9 @@ class Molecule(MSONable):
         Returns:
              a string of the Molecule in xyz file format
         """
-        output = f"{self.natoms()}\n{self.name}, generated by BasisOpt\n"
-        for i in range(self.natoms()):
-            output += self.get_line(i) + "\n"
-        return output
+        lines = [f"{self.natoms()}", f"{self.name}, generated by BasisOpt"]
+        lines.extend(self.get_lines())
+        return "\n".join(lines) + "\n"
 
     def get_line(self, i: int, atom_prefix: str = "", atom_suffix: str = "") -> str:
         """Gets a line of the xyz file representation of the Molecule
@@ -167,6 +199,26 @@ class Molecule(MSONable):
         n, c = self._atom_names[ix], self._coords[ix]
         return f"{atom_prefix}{n}{atom_suffix}\t{c[0]}\t{c[1]}\t{c[2]}"
 
+    def get_lines(self, dummy_prefix: str = "", dummy_suffix: str = "") -> list[str]:
+        """Gets every line of the xyz file representation of the Molecule in one pass,
+        as for get_line, converting the coordinates to Python floats only once per atom
+
+        Arguments:
+             dummy_prefix (str): optional string to add at start of dummy atom names
+             dummy_suffix (str): optional string to add at end of dummy atom names
+
+        Returns:
+             a list of strings of form {prefix+element+suffix} {coords}
+        """
+        dummies = set(self.dummy_atoms)
+        lines = []
+        for i, (n, c) in enumerate(zip(self._atom_names, self._coords)):
+            x, y, z = np.asarray(c).tolist()
+            if i in dummies:
+                n = f"{dummy_prefix}{n}{dummy_suffix}"
+            lines.append(f"{n}\t{x}\t{y}\t{z}")
+        return lines
+
     def natoms(self) -> int:
         """Returns number of atoms in Molecule"""
         return len(self._atom_names)
@@ -214,6 +266,23 @@ class Molecule(MSONable):
         c2 = self._coords[atom2]
         return np.linalg.norm(c1 - c2)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> object:
+        """Copies the molecule; the coordinates, basis sets, results and all
+        containers are independent of the original.
+        """
+        new = copy.copy(self)
+        memo[id(self)] = new
+        new._atom_names = list(self._atom_names)
+        new._coords = [c.copy() for c in self._coords]
+        new.dummy_atoms = list(self.dummy_atoms)
+        new.ecps = dict(self.ecps)
+        new._results = copy.deepcopy(self._results, memo)
+        new._references = copy.deepcopy(self._references, memo)
+        new.basis = copy.deepcopy(self.basis, memo)
+        new.jbasis = copy.deepcopy(self.jbasis, memo)
+        new.jkbasis = copy.deepcopy(self.jkbasis, memo)
+        return new
+
     def as_dict(self) -> dict[str, Any]:
         """Converts Molecule to MSONable dictionary
 
@@ -261,7 +330,7 @@ class Molecule(MSONable):
         instance.ecps = d.get("ecps", {})
         instance.jbasis = d.get("jbasis", None)
         instance.jkbasis = d.get("jkbasis", None)
-        instance._atom_names = d.get("atom_names", [])
+        instance._atom_names = [sys.intern(a) for a in d.get("atom_names", [])]
         instance.dummy_atoms = d.get("dummy_atoms", [])
         instance.coords = d.get("coords", [])
         instance._results = d.get("results", {})
@@ -13,6 +13,24 @@ from .regularisers import Regulariser
 from .strategies import Strategy
 
 
+def _last_evaluation(objective: Callable[[np.ndarray], float]) -> Callable[[np.ndarray], float]:
+    """Wraps an objective so that asking for it twice in a row at the same point
+    only runs the calculation once, as some minimizers repeat evaluations
+    (e.g. Nelder-Mead re-evaluating a vertex)
+    """
+    last = {}
+
+    def wrapped(x):
+        key = np.asarray(x, dtype=float).tobytes()
+        if key not in last:
+            value = objective(x)
+            last.clear()
+            last[key] = value
+        return last[key]
+
+    return wrapped
+
+
 def _atomic_opt(
     basis: InternalBasis,
     element: str,
@@ -46,7 +64,9 @@ def _atomic_opt(
         bo_logger.info("Doing step %d", strategy._step + 1)
         guess = strategy.get_active(basis, element)
         if len(guess) > 0:
-            res = minimize(objective, guess, method=algorithm, **opt_params)
+            # the strategy can change what x means between steps, so each
+            # minimization gets its own cache
+            res = minimize(_last_evaluation(objective), guess, method=algorithm, **opt_params)
             objective_value = res.fun
             info_str = "\n".join(
                 [
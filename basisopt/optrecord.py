@@ -1,4 +1,5 @@
 # regularisers, needs expanding
+import copy
 from typing import Any
 
 import numpy as np
@@ -18,13 +19,27 @@ class OptRecord(Result):
         self.coords = []
         self.molecule = None
         self.counts = None
+        self._basis_cache = {}
+
+    def _invalidate_basis_cache(self):
+        """Clears any bases memoized by get_basis"""
+        self._basis_cache = {}
+
+    def add_data(self, name: str, value: Any):
+        """Adds a data point, invalidating the basis cache"""
+        super().add_data(name, value)
+        self._invalidate_basis_cache()
+
+    def add_child(self, child: object):
+        """Adds a child Result, invalidating the basis cache"""
+        super().add_child(child)
+        self._invalidate_basis_cache()
 
     def get_molecule(self) -> Molecule:
         """Returns Molecule from species/coords"""
         if not self.molecule:
             self.molecule = Molecule(name=self.name)
-            for at, xyz in zip(self.species, self.coords):
-                self.molecule.add_atom(at, xyz)
+            self.molecule.add_atoms_bulk(self.species, self.coords)
             self.molecule.basis = self.get_basis()
         return self.molecule
 
@@ -35,7 +50,10 @@ class OptRecord(Result):
         add_atoms: list[str] = ['H'],
         ls: list[str] = ['s', 'p', 'd', 'f'],
     ) -> InternalBasis:
-        """Gets the basis from this record with additional terms
+        """Gets the basis from this record with additional terms.
+        Results are memoized, so the BSE is only queried once per
+        unique set of arguments and state of the record; a copy of
+        the memoized basis is returned.
 
         Arguments:
               step_back (int): how many steps back in the record to go
@@ -47,6 +65,25 @@ class OptRecord(Result):
                an InternalBasis corresponding to this record with any
                additional atoms specified
         """
+        # records restored from older pickles have no cache
+        if getattr(self, "_basis_cache", None) is None:
+            self._invalidate_basis_cache()
+        # children can be given new data without this record knowing, so the
+        # number of records of each shell is part of the key
+        versions = tuple(
+            (c.name, tuple(c._data_keys.get(l, 0) for l in ls)) for c in self._children
+        )
+        key = (
+            step_back,
+            default,
+            tuple(sorted(add_atoms)),
+            tuple(ls),
+            tuple(self.species),
+            versions,
+        )
+        if key in self._basis_cache:
+            return copy.deepcopy(self._basis_cache[key])
+
         unique_atoms = set(self.species)
         for a in add_atoms:
             unique_atoms.add(a.title())
@@ -54,7 +91,9 @@ class OptRecord(Result):
         for c in self._children:
             shells = [c.get_data(l, step_back=step_back) for l in ls]
             basis[c.name.lower()] = shells
-        return basis
+        self._basis_cache[key] = basis
+        # callers are free to modify what they get back, so never hand out the cached copy
+        return copy.deepcopy(basis)
 
     def get_counts(self) -> dict[str, int]:
         """Returns a dictionary of form
@@ -103,6 +142,7 @@ class OptRecord(Result):
         instance._data_values = result._data_values
         instance.depth = result.depth
         instance._children = result._children
+        instance._invalidate_basis_cache()
         instance.functional_groups = d.get("functional_groups", [])
         instance.species = d.get("species", [])
         coords = d.get("coords", [])
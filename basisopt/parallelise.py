@@ -1,11 +1,12 @@
+from collections import defaultdict
+from importlib.util import find_spec
+from itertools import chain
 from typing import Any, Callable
 
-from . import api
 from .util import bo_logger
 
-if api._PARALLEL:
-    from distributed import Client, LocalCluster, wait
-else:
+# distributed is slow to import, so it is only loaded once distribute is called
+if find_spec("distributed") is None:
     bo_logger.warning("Dask not installed, parallelisation not available")
 
 
@@ -47,20 +48,33 @@ def distribute(
     Returns:
          a list of results ordered by process ID
     """
+    if len(x) == 0:
+        return []
+    from distributed import Client, LocalCluster, as_completed
+
     n_chunks = len(x) // n_proc
     if len(x) % n_proc > 0:
         n_chunks += 1
     new_x = chunk(x, n_chunks)
 
+    # one cluster serves every chunk, rather than paying the
+    # worker start-up cost for each chunk in turn
     all_results = []
-    for i in range(n_chunks):
-        cluster = LocalCluster(n_workers=len(new_x[i]), processes=True)
-        client = Client(cluster)
-        ens = client.map(func, new_x[i], **kwargs)
-        wait(ens)
-        results = [e.result() for e in ens]
-        all_results.append(results)
-        client.close()
-        cluster.close()
+    with LocalCluster(n_workers=len(new_x[0]), processes=True) as cluster, Client(
+        cluster
+    ) as client:
+        for sub_x in new_x:
+            ens = client.map(func, sub_x, **kwargs)
+            # gather results as they finish, keeping the input order;
+            # identical inputs can share a key, so track every position
+            positions = defaultdict(list)
+            for ix, e in enumerate(ens):
+                positions[e.key].append(ix)
+            results = [None] * len(ens)
+            for e, value in as_completed(ens, with_results=True):
+                for ix in positions[e.key]:
+                    results[ix] = value
+                e.release()
+            all_results.append(results)
 
-    return [item for sublist in all_results for item in sublist]
+    return list(chain.from_iterable(all_results))
@@ -17,23 +17,23 @@ _VALUE_NAMES = ["Ee", "Re", "BRot", "ARot", "We", "Wx", "Wy", "De", "D0"]
 DunhamResults = tuple[np.poly1d, float, np.ndarray]
 
 
-def dunham(
-    energies: np.ndarray,
-    distances: np.ndarray,
-    mu: float,
-    poly_order: int = 6,
-    angstrom: bool = True,
-    Emax: float = 0,
-) -> DunhamResults:
-    "Performs a Dunham analysis on a diatomic, given energy/distance values around a minimum and the reduced mass mu"
-    # convert units
+def _spectroscopic_constants(
+    pt: np.ndarray, re: float, mu: float, poly_order: int, Emax: float
+) -> np.ndarray:
+    """Computes the spectroscopic constants from the Taylor series coefficients
+    of a fitted potential about its minimum
+
+    Arguments:
+         pt (numpy array): 0th - nth Taylor series coefficients at eq. separation
+         re (float): equilibrium separation (Bohr)
+         mu (float): reduced mass of the diatomic
+         poly_order (int): order of the fitted polynomial, >= 3
+         Emax (float): energy in Ha to calculate dissociation from
+
+    Returns:
+         array of results in order specified by _VALUE_NAMES
+    """
     An = mu * data.FORCE_MASS
-    if angstrom:
-        distances *= data.TO_BOHR
-    poly_order = max(poly_order, 3)
-
-    # perform polynomial fit to data
-    p, xref, re, pt = fit_poly(distances, energies, poly_order)
 
     # Energy at minimum, first rotational constant, and first vibrational constant
     Ee = pt[0]
@@ -41,7 +41,7 @@ def dunham(
     We = data.TO_CM * np.sqrt(2.0 * np.abs(pt[2]) / An)
 
     # Compute normalised derivatives
-    npt = [(pt[i + 3] / pt[2]) * re ** (i + 1) for i in range(poly_order - 2)]
+    npt = (pt[3 : poly_order + 1] / pt[2]) * re ** np.arange(1, poly_order - 1)
 
     # Second rotational constant
     Ae = -6.0 * Be**2 * (1.0 + npt[0]) / We
@@ -71,7 +71,27 @@ def dunham(
         De = (Emax - Ee) * data.TO_EV
         D0 = De - 0.5 * (We - 0.5 * Wexe) * data.TO_EV / data.TO_CM
 
-    results = np.array([Ee, re * data.TO_ANGSTROM, Be, Ae, We, Wexe, Weye, De, D0])
+    return np.array([Ee, re * data.TO_ANGSTROM, Be, Ae, We, Wexe, Weye, De, D0])
+
+
+def dunham(
+    energies: np.ndarray,
+    distances: np.ndarray,
+    mu: float,
+    poly_order: int = 6,
+    angstrom: bool = True,
+    Emax: float = 0,
+) -> DunhamResults:
+    "Performs a Dunham analysis on a diatomic, given energy/distance values around a minimum and the reduced mass mu"
+    # convert units
+    if angstrom:
+        distances *= data.TO_BOHR
+    poly_order = max(poly_order, 3)
+
+    # perform polynomial fit to data
+    p, xref, re, pt = fit_poly(distances, energies, poly_order)
+
+    results = _spectroscopic_constants(np.asarray(pt), re, mu, poly_order, Emax)
     return p, xref, results
 
 
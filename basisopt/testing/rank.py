@@ -1,23 +1,215 @@
 # funcitonality to rank basis shells
 import copy
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 import numpy as np
 
 from basisopt import api
 from basisopt.basis import uncontract_shell
 from basisopt.basis.atomic import AtomicBasis
-from basisopt.containers import InternalBasis
+from basisopt.containers import InternalBasis, Shell
 from basisopt.exceptions import FailedCalculation
+from basisopt.molecule import Molecule
 from basisopt.util import bo_logger
 
 
+def _evaluate(mol: Molecule, eval_type: str, params: dict[str, Any]) -> Any:
+    """Runs a calculation through the current backend and returns the value;
+    identical calculations are reused if the result cache is turned on,
+    see api.set_result_cache
+
+    Raises:
+         FailedCalculation
+    """
+    if api.run_calculation(evaluate=eval_type, mol=mol, params=params) != 0:
+        raise FailedCalculation
+    return api.get_backend().get_value(eval_type)
+
+
+def _evaluate_all(
+    mols: list[Molecule], eval_type: str, params: dict[str, Any], parallel: bool = False
+) -> list[Any]:
+    """As _evaluate, but for a set of molecules, run through api.run_all
+
+    Arguments:
+         mols (list): Molecule objects, which must have unique names
+         eval_type (str): property to evaluate
+         params (dict): parameters passed to the backend
+         parallel (bool): if True, the calculations are distributed
+
+    Returns:
+         a list of values in the same order as mols
+
+    Raises:
+         FailedCalculation
+    """
+    results = api.run_all(evaluate=eval_type, mols=mols, params=params, parallel=parallel)
+    return [results[m.name] for m in mols]
+
+
+def _trial_molecule(
+    mol: Molecule, attr: str, element: str, s: int, exps: np.ndarray, name: str
+) -> Molecule:
+    """Returns a shallow copy of mol where shell s of element, in the basis
+    given by attr, is replaced by an uncontracted shell with the given exponents.
+    The original molecule and basis are untouched.
+    """
+    trial = copy.copy(mol)
+    trial.name = name
+    shells = list(getattr(mol, attr)[element])
+    new_shell = copy.copy(shells[s])
+    new_shell.exps = exps
+    uncontract_shell(new_shell)
+    shells[s] = new_shell
+    new_basis = dict(getattr(mol, attr))
+    new_basis[element] = shells
+    setattr(trial, attr, new_basis)
+    return trial
+
+
+def _setup_ranking(
+    atomic: AtomicBasis,
+    shells: Optional[list[int]],
+    eval_type: str,
+    basis_type: str,
+    params: dict[str, Any],
+) -> tuple[Molecule, str, list[Shell], list[int], Any]:
+    """Prepares to rank the primitives of an AtomicBasis, calculating
+    the reference value and storing it on the atomic molecule
+
+    Returns:
+         (mol, attr, basis, shells, reference), where mol is the molecule
+         to run calculations on (the atomic molecule itself, not a copy),
+         attr the name of its basis attribute being ranked, basis the list
+         of Shells for the atom, and shells the indices of the shells to rank
+
+    Raises:
+         FailedCalculation
+    """
+    mol = atomic._molecule
+    if basis_type == 'jfit':
+        attr = 'jbasis'
+    elif basis_type == 'jkfit':
+        attr = 'jkbasis'
+    else:
+        attr = 'basis'
+    basis = getattr(mol, attr)[atomic._symbol]
+
+    if not shells:
+        shells = list(range(len(basis)))  # do all
+
+    # Calculate reference value
+    reference = _evaluate(mol, eval_type, params)
+    # prefix result  as being for ranking
+    atomic._molecule.add_reference('rank_' + eval_type, reference)
+    return mol, attr, basis, shells, reference
+
+
+def _errors(values: Any, reference: Any, batched: bool = False) -> Any:
+    """Returns the change in a property from its reference value. For array-valued
+    properties, e.g. dipoles, this is the norm of the difference, as for the loss
+    in a Strategy, so that each trial always gives a single error.
+
+    Arguments:
+         values: value of the property, or if batched an array of values
+             for several calculations along the first axis
+         reference: reference value of the property
+         batched (bool): if True, returns an array with one error per value
+
+    Returns:
+         the error as a float, or a numpy array of errors if batched
+    """
+    diff = np.asarray(values, dtype=float) - reference
+    if batched:
+        return np.linalg.norm(diff.reshape(diff.shape[0], -1), axis=1)
+    return float(np.linalg.norm(diff))
+
+
+def _leave_one_out_exps(exps: np.ndarray) -> np.ndarray:
+    """Returns an (n, n-1) array whose ith row is exps with the ith exponent
+    removed, built with a single fancy index rather than n calls to np.delete
+    """
+    n = exps.size
+    cols = np.arange(n - 1)
+    return exps[cols + (cols >= np.arange(n)[:, None])]
+
+
+def _leave_one_out(
+    mol: Molecule,
+    shell: Shell,
+    order: Iterable[int],
+    reference: Any,
+    eval_type: str,
+    params: dict[str, Any],
+    err: np.ndarray,
+    thresh: Optional[float] = None,
+):
+    """Removes each exponent from a shell in turn, in the given order, and
+    calculates the change in the target property. The shell is restored afterwards.
+
+    Arguments:
+         mol (Molecule): molecule whose basis contains shell
+         shell (Shell): the shell to trim
+         order (iterable): indices of the exponents to remove, in order
+         reference: the value of the target with the full shell
+         eval_type (str): property to evaluate
+         params (dict): parameters to pass to the backend
+         err (numpy array): array the error for each exponent is written into;
+             entries for exponents that are not tried are left untouched
+         thresh (float): if given, stop once an error is >= thresh
+
+    Raises:
+         FailedCalculation
+    """
+    if shell.exps.size == 0:
+        return
+
+    # keep the old parameters; these are only ever rebound below, never
+    # modified in place, so there is no need to copy them
+    exps, coefs = shell.exps, shell.coefs
+
+    # make uncontracted
+    candidates = _leave_one_out_exps(exps)
+    shell.exps = candidates[0]
+    uncontract_shell(shell)
+
+    # remove each exponent one at a time by swapping in the precomputed rows;
+    # the trials are near-identical, so run them in one backend session
+    try:
+        with api.backend_session():
+            for i in order:
+                shell.exps = candidates[i]
+                value = _evaluate(mol, eval_type, params)
+                err[i] = _errors(value, reference)
+                if thresh is not None and err[i] >= thresh:
+                    break
+    finally:
+        # reset shell to original
+        shell.exps = exps
+        shell.coefs = coefs
+
+
+def _split_errors(
+    all_err: np.ndarray, sizes: list[int]
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Sorts a padded (nshells, max_n) array of errors with a single argsort,
+    and splits it back into one array of errors and ranks per shell.
+    Padding must be infinite, and the sort is stable so that it always
+    comes after any genuine errors in each row.
+    """
+    ranks = np.argsort(all_err, axis=1, kind='stable')
+    errors = [all_err[ix, :n] for ix, n in enumerate(sizes)]
+    ranks = [ranks[ix, :n] for ix, n in enumerate(sizes)]
+    return errors, ranks
+
+
 def rank_primitives(
     atomic: AtomicBasis,
     shells: Optional[list[int]] = None,
     eval_type: str = 'energy',
     basis_type: str = 'orbital',
     params={},
+    parallel: bool = False,
 ) -> tuple[list[np.ndarray], list[np.ndarray]]:
     """Systematically eliminates exponents from shells in an AtomicBasis
     to determine how much they contribute to the target property
@@ -30,6 +222,8 @@ def rank_primitives(
          basis_type (str): "orbital/jfit/jkfit"
          params (dict): parameters  to pass to the backend,
                  see relevant Wrapper for options
+         parallel (bool): if True, the calculations with each exponent removed
+                 are distributed in parallel (see api.run_all)
 
     Returns:
          (errors, ranks), where errors is a list of numpy arrays with the
@@ -41,55 +235,81 @@ def rank_primitives(
     Raises:
          FailedCalculation
     """
-    mol = copy.copy(atomic._molecule)
-    if basis_type == 'jfit':
-        basis = mol.jbasis[atomic._symbol]
-    elif basis_type == 'jkfit':
-        basis = mol.jkbasis[atomic._symbol]
+    mol, attr, basis, shells, reference = _setup_ranking(
+        atomic, shells, eval_type, basis_type, params
+    )
+
+    sizes = [len(basis[s].exps) for s in shells]
+    all_err = np.full((len(shells), max(sizes, default=0)), np.inf)
+    if parallel:
+        # every trial needs its own molecule to be run concurrently, and the trials
+        # for all shells are submitted as one batch so that no workers sit idle
+        trials = [
+            _trial_molecule(mol, attr, atomic._symbol, s, exps, f"{mol.name}-r{s}.{i}")
+            for s in shells
+            for i, exps in enumerate(_leave_one_out_exps(basis[s].exps))
+        ]
+        values = np.asarray(_evaluate_all(trials, eval_type, params, parallel=True), dtype=float)
+        # the mask selects the unpadded entries in the same row-major order as trials
+        mask = np.arange(all_err.shape[1]) < np.array(sizes, dtype=int)[:, None]
+        all_err[mask] = _errors(values, reference, batched=True)
     else:
-        basis = mol.basis[atomic._symbol]
+        for ix, s in enumerate(shells):
+            err = all_err[ix, : sizes[ix]]
+            _leave_one_out(mol, basis[s], range(sizes[ix]), reference, eval_type, params, err)
 
-    if not shells:
-        shells = list(range(len(basis)))  # do all
+    return _split_errors(all_err, sizes)
 
-    # Calculate reference value
-    if api.run_calculation(evaluate=eval_type, mol=mol, params=params) != 0:
-        raise FailedCalculation
-    reference = api.get_backend().get_value(eval_type)
-    # prefix result  as being for ranking
-    atomic._molecule.add_reference('rank_' + eval_type, reference)
 
-    errors = []
-    ranks = []
-    for s in shells:
+def rank_primitives_screened(
+    atomic: AtomicBasis,
+    thresh: float = 1e-4,
+    shells: Optional[list[int]] = None,
+    eval_type: str = 'energy',
+    basis_type: str = 'orbital',
+    params={},
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """As rank_primitives, but the exponents in each shell are removed from smallest to
+    largest, stopping as soon as one changes the target property by at least thresh.
+    This assumes that more diffuse primitives contribute less, and any exponent that was
+    not tried is given an infinite error, so it is only suitable for finding which
+    exponents fall below thresh, e.g. in reduce_primitives.
+
+    Arguments:
+         atomic: AtomicBasis object
+         thresh (float): stop trying a shell once an error is >= thresh
+         shells (list): list of indices for shells in the AtomicBasis
+             to be ranked. If None, will rank all shells
+         eval_type (str): property to evaluate (e.g. energy)
+         basis_type (str): "orbital/jfit/jkfit"
+         params (dict): parameters  to pass to the backend,
+                 see relevant Wrapper for options
+
+    Returns:
+         (errors, ranks), as for rank_primitives
+
+    Raises:
+         FailedCalculation
+    """
+    mol, _, basis, shells, reference = _setup_ranking(atomic, shells, eval_type, basis_type, params)
+
+    sizes = [len(basis[s].exps) for s in shells]
+    all_err = np.full((len(shells), max(sizes, default=0)), np.inf)
+    for ix, s in enumerate(shells):
         shell = basis[s]
-        # copy old parameters
-        exps = shell.exps.copy()
-        coefs = shell.coefs.copy()
-        n = len(exps)
-
-        # make uncontracted
-        shell.exps = np.zeros(n - 1)
-        uncontract_shell(shell)
-        err = np.zeros(n)
-
-        # remove each exponent one at a time
-        for i in range(n):
-            shell.exps[:i] = exps[:i]
-            shell.exps[i:] = exps[i + 1 :]
-            success = api.run_calculation(evaluate=eval_type, mol=mol, params=params)
-            if success != 0:
-                raise FailedCalculation
-            value = api.get_backend().get_value(eval_type)
-            err[i] = np.abs(value - reference)
-
-        errors.append(err)
-        ranks.append(np.argsort(err))
-        # reset shell to original
-        shell.exps = exps
-        shell.coefs = coefs
+        order = np.argsort(shell.exps)
+        err = all_err[ix, : sizes[ix]]
+        _leave_one_out(mol, shell, order, reference, eval_type, params, err, thresh=thresh)
+
+    return _split_errors(all_err, sizes)
 
-    return errors, ranks
+
+def _find_cutoff(errors: np.ndarray, ranks: np.ndarray, thresh: float) -> int:
+    """Returns the number of exponents in a shell whose error is below thresh,
+    i.e. the index in ranks of the first exponent that should be kept.
+    errors[ranks] is sorted, so this is a single binary search.
+    """
+    return int(np.searchsorted(errors[ranks], thresh, side='left'))
 
 
 def reduce_primitives(
@@ -98,6 +318,8 @@ def reduce_primitives(
     shells: Optional[list[int]] = None,
     eval_type: str = 'energy',
     params: dict[str, Any] = {},
+    parallel: bool = False,
+    screen: bool = False,
 ) -> tuple[InternalBasis, Any]:
     """Rank the primitive functions in an atomic basis, and remove those that contribute
     less than a threshold. TODO: add checking that does not go below minimal config
@@ -109,6 +331,10 @@ def reduce_primitives(
          shells (list): list of indices of shells to be pruned; if None, does all shells
          eval_type (str): property to evaluate
          params (dict): parameters to pass to the backend
+         parallel (bool): if True, the ranking calculations are distributed in parallel
+         screen (bool): if True, uses rank_primitives_screened, which stops trying exponents
+             in a shell once one is above thresh - much cheaper, but assumes that more
+             diffuse exponents contribute less
 
     Returns:
          (basis, delta) where basis is the pruned basis set (this is non-destructive to the
@@ -118,36 +344,44 @@ def reduce_primitives(
     Raises:
          FailedCalculation
     """
-    mol = copy.copy(atomic._molecule)
-    basis = mol.basis[atomic.symbol]
+    mol = atomic._molecule
+    basis = mol.basis[atomic._symbol]
     if not shells:
         shells = list(range(len(basis)))  # do all
     # first rank the primitives
-    errors, ranks = rank_primitives(atomic, shells=shells, eval_type=eval_type, params=params)
+    if screen:
+        errors, ranks = rank_primitives_screened(
+            atomic, thresh=thresh, shells=shells, eval_type=eval_type, params=params
+        )
+    else:
+        errors, ranks = rank_primitives(
+            atomic, shells=shells, eval_type=eval_type, params=params, parallel=parallel
+        )
 
-    # now reduce
-    for s, e, r in zip(shells, errors, ranks):
-        shell = basis[s]
-        n = shell.exps.size
-        start = 0
-        value = e[r[0]]
-        while (start < n - 1) and (value < thresh):
-            start += 1
-            bo_logger.debug("%.2e, %s, %d", e, str(r), start)
-            value = e[r[start]]
-
-        if start == (n - 1):
-            bo_logger.warning("Shell %d with l=%d now empty", s, shell.l)
-            shell.exps = []
-            shell.coefs = []
-        else:
-            shell.exps = shell.exps[r[start:]]
-            uncontract_shell(shell)
-
-    success = api.run_calculation(evaluate=eval_type, mol=mol, params=params)
-    if success != 0:
-        raise FailedCalculation
-    result = api.get_backend().get_value(eval_type)
-    delta = result - atomic._molecule.get_reference('rank_' + eval_type)
+    # trim the shells in place, checkpointing them so the original can be restored;
+    # shell arrays are only ever rebound, so the snapshot needs no copies
+    snapshot = {s: (basis[s].exps, basis[s].coefs) for s in shells}
+    try:
+        for s, e, r in zip(shells, errors, ranks):
+            shell = basis[s]
+            n = shell.exps.size
+            start = _find_cutoff(e, r, thresh)
+            bo_logger.debug("shell trim: e=%s r=%s start=%d", e, r, start)
+
+            if start == n:
+                bo_logger.warning("Shell %d with l=%s now empty", s, shell.l)
+                shell.exps = np.array([])
+                shell.coefs = []
+            else:
+                shell.exps = shell.exps[r[start:]]
+                uncontract_shell(shell)
+
+        result = _evaluate(mol, eval_type, params)
+        reduced = dict(mol.basis)
+        reduced[atomic._symbol] = [copy.copy(shell) for shell in basis]
+    finally:
+        for s, (exps, coefs) in snapshot.items():
+            basis[s].exps, basis[s].coefs = exps, coefs
 
-    return mol.basis, delta
+    delta = result - mol.get_reference('rank_' + eval_type)
+    return reduced, delta
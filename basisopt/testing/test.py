@@ -1,4 +1,5 @@
 # base test types
+from collections import OrderedDict
 from typing import Any, Optional
 
 from basisopt import api
@@ -10,6 +11,21 @@ from basisopt.exceptions import (
     PropertyNotAvailable,
 )
 from basisopt.molecule import Molecule
+from basisopt.wrappers.wrapper import Wrapper
+
+"""Calculation types available for each Wrapper type, see _available_properties"""
+_AVAILABLE = {}
+
+
+def _available_properties(wrapper: Wrapper) -> frozenset[str]:
+    """Returns the set of calculation types available with a backend.
+    Availability is fixed by the decorators on the Wrapper class,
+    so the set is only built once per class.
+    """
+    cls = type(wrapper)
+    if cls not in _AVAILABLE:
+        _AVAILABLE[cls] = frozenset(wrapper.all_available())
+    return _AVAILABLE[cls]
 
 
 class Test(Result):
@@ -111,6 +127,9 @@ class PropertyTest(Test):
 
     Additional attributes:
          eval_type (str): property to evaluate, e.g. 'energy', 'dipole'
+         cache_size (int): number of values kept so that identical calculations
+             (same method, basis, params and geometry) are not repeated; 0 turns
+             caching off
     """
 
     def __init__(
@@ -121,10 +140,21 @@ class PropertyTest(Test):
         xyz_file: Optional[str] = None,
         charge: int = 0,
         mult: int = 1,
+        cache_size: int = 0,
     ):
         super().__init__(name, mol=mol, xyz_file=xyz_file, charge=charge, mult=mult)
         self._eval_type = ''
         self.eval_type = prop
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restores a pickled PropertyTest, giving tests pickled before
+        caching was added an empty, disabled cache
+        """
+        state.setdefault('cache_size', 0)
+        state.setdefault('_cache', OrderedDict())
+        self.__dict__.update(state)
 
     @property
     def eval_type(self) -> str:
@@ -132,8 +162,7 @@ class PropertyTest(Test):
 
     @eval_type.setter
     def eval_type(self, name: str):
-        wrapper = api.get_backend()
-        if name in wrapper.all_available():
+        if name in _available_properties(api.get_backend()):
             self._eval_type = name
         else:
             raise PropertyNotAvailable(name)
@@ -151,16 +180,30 @@ class PropertyTest(Test):
         """
         if self.molecule is None:
             raise EmptyCalculation
-        # run calculation
         self.molecule.basis = basis
         self.molecule.method = method
-        success = api.run_calculation(evaluate=self.eval_type, mol=self.molecule, params=params)
-        if success != 0:
-            raise FailedCalculation
 
-        # retrieve result, archive _and_ return
-        wrapper = api.get_backend()
-        value = wrapper.get_value(self.eval_type)
+        key = None
+        if self.cache_size > 0:
+            key = api.calculation_key(self.molecule, self.eval_type, params)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            value = self._cache[key]
+        else:
+            # run calculation
+            success = api.run_calculation(evaluate=self.eval_type, mol=self.molecule, params=params)
+            if success != 0:
+                raise FailedCalculation
+
+            # retrieve result
+            wrapper = api.get_backend()
+            value = wrapper.get_value(self.eval_type)
+            if key is not None:
+                self._cache[key] = value
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # archive _and_ return
         self.add_data(self.name + "_" + self.eval_type, value)
         return value
 
@@ -169,13 +212,15 @@ class PropertyTest(Test):
         d["@module"] = type(self).__module__
         d["@class"] = type(self).__name__
         d["eval_type"] = self.eval_type
+        d["cache_size"] = self.cache_size
         return d
 
     @classmethod
     def from_dict(cls, d):
         test = Test.from_dict(d)
         prop = d.get("eval_type", 'energy')
-        instance = cls(test.name, prop=prop, mol=test.molecule)
+        cache_size = d.get("cache_size", 0)
+        instance = cls(test.name, prop=prop, mol=test.molecule, cache_size=cache_size)
         instance.reference = test.reference
         instance._data_keys = test._data_keys
         instance._data_values = test._data_values
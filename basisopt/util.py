@@ -1,4 +1,5 @@
 # utility functions
+import base64
 import json
 import logging
 from typing import Any
@@ -8,9 +9,38 @@ from monty.json import MontyDecoder, MontyEncoder, MSONable
 
 bo_logger = logging.getLogger('basisopt')  # internal logging object
 
+"""Shared decoder for MSONable objects, MontyDecoder holds no state"""
+_DECODER = MontyDecoder()
+
+
+def _pack_arrays(obj: Any) -> Any:
+    """Recursively replaces numeric numpy arrays in a dictionary tree
+    with base64-encoded binary blobs, see _unpack_array
+    """
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in 'biufc':
+        return {
+            "@type": "ndarray",
+            "dtype": obj.dtype.str,
+            "shape": list(obj.shape),
+            "data": base64.b64encode(np.ascontiguousarray(obj).tobytes()).decode('ascii'),
+        }
+    if isinstance(obj, dict):
+        return {k: _pack_arrays(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_pack_arrays(v) for v in obj]
+    return obj
+
+
+def _unpack_array(d: dict[str, Any]) -> Any:
+    """JSON object hook that turns blobs written by _pack_arrays back into arrays"""
+    if d.get("@type") == "ndarray":
+        data = base64.b64decode(d["data"])
+        return np.frombuffer(data, dtype=d["dtype"]).reshape(d["shape"]).copy()
+    return d
+
 
 def read_json(filename: str) -> MSONable:
-    """Reads an MSONable object from file
+    """Reads an MSONable object from file, written by write_json
 
     Arguments:
          filename (str): path to JSON file
@@ -19,21 +49,26 @@ def read_json(filename: str) -> MSONable:
          object
     """
     with open(filename, 'r', encoding='utf-8') as f:
-        obj = json.load(f, cls=MontyDecoder)
+        obj = _DECODER.process_decoded(json.load(f, object_hook=_unpack_array))
     bo_logger.info("Read %s from %s", type(obj).__name__, filename)
     return obj
 
 
-def write_json(filename: str, obj: MSONable):
+def write_json(filename: str, obj: MSONable, fast: bool = False):
     """Writes an MSONable object to file
 
     Arguments:
          filename (str): path to JSON file
          obj (MSONable): object to be written
+         fast (bool): if True, numpy arrays are stored as binary blobs rather
+             than lists of numbers, which is smaller, faster to read and write,
+             and exact, but no longer human readable
     """
     obj_type = type(obj).__name__
     if isinstance(obj, MSONable):
         bo_logger.info(f"Writing {obj_type} to {filename}")
+        if fast:
+            obj = _pack_arrays(obj.as_dict())
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(obj, f, cls=MontyEncoder)
     else:
@@ -41,8 +76,123 @@ def write_json(filename: str, obj: MSONable):
 
 
 def dict_decode(d: dict[str, Any]) -> dict[str, Any]:
-    decoder = MontyDecoder()
-    return {k: decoder.process_decoded(v) for k, v in d.items()}
+    return {k: _DECODER.process_decoded(v) for k, v in d.items()}
+
+
+def _batched_polyfit(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Least-squares fit of a polynomial of order n to each row of (x, y),
+    solved for all rows at once with a batched pseudo-inverse. As with
+    np.polyfit, the Vandermonde columns are scaled to improve conditioning,
+    and underdetermined fits give the minimum norm solution.
+
+    Returns:
+         (K, n+1) array of coefficients, in increasing powers
+    """
+    vander = x[:, :, None] ** np.arange(n + 1)
+    scale = np.sqrt(np.sum(vander * vander, axis=1))
+    rcond = x.shape[1] * np.finfo(float).eps
+    inv = np.linalg.pinv(vander / scale[:, None, :], rcond=rcond)
+    return np.einsum('kji,ki->kj', inv, y) / scale
+
+
+def _batched_roots(c: np.ndarray) -> np.ndarray:
+    """Finds the roots of a stack of polynomials with a single batched
+    eigenvalue problem for their companion matrices.
+
+    Arguments:
+         c (numpy array): (K, m+1) coefficients in increasing powers
+
+    Returns:
+         (K, m) complex array of roots; polynomials whose leading coefficient
+         vanishes have fewer roots, and are padded with nan
+    """
+    k, m = c.shape[0], c.shape[1] - 1
+    roots = np.full((k, m), np.nan, dtype=complex)
+    if m < 1:
+        return roots
+    lead = c[:, -1]
+    good = np.abs(lead) > 1e-14 * np.max(np.abs(c), axis=1)
+    if np.any(good):
+        comp = np.zeros((np.count_nonzero(good), m, m))
+        comp[:, np.arange(1, m), np.arange(m - 1)] = 1.0
+        comp[:, :, -1] = -c[good, :-1] / lead[good, None]
+        roots[good] = np.linalg.eigvals(comp)
+    # degenerate leading coefficients are rare, so fall back to one at a time
+    for ix in np.flatnonzero(~good):
+        r = np.polynomial.polynomial.polyroots(np.trim_zeros(c[ix], 'b'))
+        roots[ix, : r.size] = r
+    return roots
+
+
+def _taylor_shift(c: np.ndarray, dx: np.ndarray) -> np.ndarray:
+    """Shifts a stack of polynomials by repeated synthetic (Horner) division, so that
+    the ith row of the result has the coefficients of p_i(x + dx_i). These are the
+    Taylor series coefficients of p_i about dx_i, with no derivatives or factorials.
+
+    Arguments:
+         c (numpy array): (K, n+1) coefficients in increasing powers
+         dx (numpy array): (K,) shift for each polynomial
+
+    Returns:
+         (K, n+1) array of shifted coefficients, in increasing powers
+    """
+    b = np.array(c, dtype=float)
+    n = b.shape[1] - 1
+    for k in range(n):
+        for j in range(n - 1, k - 1, -1):
+            b[:, j] += b[:, j + 1] * dx
+    return b
+
+
+def fit_poly_batch(
+    x: np.ndarray, y: np.ndarray, n: int = 6
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fits polynomials of order n to several curves of (x [Bohr], y [Hartree])
+    coordinates at once, and calculates the data necessary for a Dunham analysis.
+    See fit_poly for a single curve.
+
+    Arguments:
+         x (numpy array): (K, npts) atomic separations in Bohr
+         y (numpy array): (K, npts) energies at each point in Hartree
+         n (int): order of polynomial to fit
+
+    Returns:
+         (K, n+1) polynomial coefficients in increasing powers (as for np.polynomial),
+         reference separations (Bohr), equilibrium separations (Bohr), and
+         (K, n+1) first (n+1) Taylor series coefficients at eq. sep.
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    rows = np.arange(x.shape[0])
+
+    # Find best guess at minimum and shift coordinates
+    xref = x[rows, np.argmin(y, axis=1)]
+    xshift = x - xref[:, None]
+
+    # Fit polynomials to shifted systems
+    c = _batched_polyfit(xshift, y, n)
+
+    # Find the true minima by interpolation, if possible,
+    # taking the critical point closest to the best guess
+    roots = _batched_roots(c[:, 1:] * np.arange(1, n + 1))
+    xmin = np.min(xshift, axis=1, keepdims=True) - 0.1
+    xmax = np.max(xshift, axis=1, keepdims=True) + 0.1
+    crit = (np.abs(roots.imag) < 1e-8) & (xmin < roots.real) & (roots.real < xmax)
+    found = np.any(crit, axis=1)
+    dx = np.where(crit, roots.real, np.inf)
+    dx = dx[rows, np.argmin(np.abs(dx), axis=1)]
+    dx[~found] = 0.0
+    re = xref + dx  # Equilibrium geometry
+
+    # Calculate 0th - nth Taylor series coefficients at true minimum
+    pt = _taylor_shift(c, dx)
+    pt[~found] = 0.0
+    if not np.all(found):
+        bo_logger.warning("Minimum not found in polynomial fit for %d curves", np.sum(~found))
+
+    # Return fitted polynomials, x-shifts, equilibrium bond lengths,
+    # and Taylor series coefficients
+    return c, xref, re, pt
 
 
 def fit_poly(
@@ -60,29 +210,6 @@ def fit_poly(
          poly1d object, reference separation (Bohr), equilibrium separation (Bohr),
          first (n+1) Taylor series coefficients at eq. sep.
     """
-    # Find best guess at minimum and shift coordinates
-    xref = x[np.argmin(y)]
-    xshift = x - xref
-
-    # Fit polynomial to shifted system
-    z = np.polyfit(xshift, y, n)
-    p = np.poly1d(z)
-
-    # Find the true minimum by interpolation, if possible
-    xmin = min(xshift) - 0.1
-    xmax = max(xshift) + 0.1
-    crit_points = [x.real for x in p.deriv().r if np.abs(x.imag) < 1e-8 and xmin < x.real < xmax]
-    if len(crit_points) == 0:
-        bo_logger.warning("Minimum not found in polynomial fit")
-        # Set outputs to default values
-        re = xref
-        pt = [0.0] * (n + 1)
-    else:
-        dx = crit_points[0]
-        re = xref + dx  # Equilibrium geometry
-        # Calculate 0th - nth Taylor series coefficients at true minimum
-        pt = [p.deriv(i)(dx) / np.math.factorial(i) for i in range(n + 1)]
-
-    # Return fitted polynomial, x-shift, equilibrium bond length,
-    # and Taylor series coefficients
-    return p, xref, re, pt
+    z, xref, re, pt = fit_poly_batch(x, y, n)
+    # poly1d takes coefficients in decreasing powers
+    return np.poly1d(z[0][::-1]), xref[0], re[0], list(pt[0])
@@ -1,7 +1,6 @@
 # correlation consistent plots
 from typing import Callable
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from basisopt.basis.basis import Basis
@@ -10,13 +9,17 @@ from basisopt.containers import InternalBasis, OptResult
 
 def extract_steps(opt_results: OptResult, key: str = "fun"):
     """Get the given key value for each step
-    in an opt_results dictionary
+    in an opt_results dictionary, as numpy arrays
+    of step numbers and values
     """
-    steps, values = [], []
-    for k, d in opt_results.items():
-        steps.append(int(k[9:]))
-        values.append(d.get(key, 0.0))
-    return steps, np.array(values)
+    # keys are of the form 'atomicoptN'
+    dtype = np.dtype([('step', int), ('value', float)])
+    arr = np.fromiter(
+        ((int(k[9:]), d.get(key, 0.0)) for k, d in opt_results.items()),
+        dtype=dtype,
+        count=len(opt_results),
+    )
+    return arr['step'], arr['value']
 
 
 Transform = Callable[[np.ndarray], np.ndarray]
@@ -42,6 +45,8 @@ def plot_objective(
     Returns:
         matplotlib (figure, axis) tuple
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     fig.set_size_inches(figsize)
     ax.set_xlabel("Optimization step")
@@ -51,12 +56,13 @@ def plot_objective(
         steps = {}
         values = {}
         results = basis.opt_results
-        for k, v in results.items():
-            if 'atomicopt' in k:
-                key = basis._symbol
-                steps[key], values[key] = extract_steps(results, key='fun')
-                break
-            steps[k], values[k] = extract_steps(v, key='fun')
+        if any('atomicopt' in k for k in results):
+            # results of a single atomic optimization
+            key = basis._symbol
+            steps[key], values[key] = extract_steps(results, key='fun')
+        else:
+            for k, v in results.items():
+                steps[k], values[k] = extract_steps(v, key='fun')
 
         for k, v in steps.items():
             ax.plot(x_transform(v), y_transform(values[k]), 'x', ms=8, label=k)
@@ -87,33 +93,36 @@ def plot_exponents(
     Returns:
             matplotlib figure, [list of matplotlib axes]
     """
-    natoms = len(atoms)
-    if natoms > 1 and split_by_shell:
-        fig, axes = plt.subplots(ncols=natoms, sharey=True)
+    # one plot per atom if splitting by shell, otherwise all atoms on one plot
+    if len(atoms) > 1 and split_by_shell:
         to_build = [{k: basis[k.lower()]} for k in atoms]
     else:
-        fig, ax = plt.subplots()
-        axes = [ax]
         to_build = [{k: basis[k.lower()] for k in atoms}]
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(ncols=len(to_build), sharey=True, squeeze=False)
+    axes = list(axes[0])
     fig.set_size_inches(figsize)
 
     def _single_plot(bas, ax):
-        flat_bases = []
-        for k, v in bas.items():
-            flat_basis = [s.exps for s in v]
-            if log_scale:
-                flat_basis = [np.log10(x) for x in flat_basis]
-            if not split_by_shell:
-                flat_basis = np.concatenate(flat_basis)
-                flat_bases.append(flat_basis)
-            else:
-                flat_bases = flat_basis
-        colors = [f"C{i}" for i in range(len(flat_bases))]
+        shells = [s for v in bas.values() for s in v]
+
+        # take the log of all exponents at once, then split them up
+        # into one set per shell, or one set per atom
+        all_exps = np.concatenate([s.exps for s in shells])
+        if log_scale:
+            all_exps = np.log10(all_exps)
+        if split_by_shell:
+            sizes = [s.exps.size for s in shells]
+        else:
+            sizes = [sum(s.exps.size for s in v) for v in bas.values()]
+        flat_bases = np.split(all_exps, np.cumsum(sizes)[:-1])
+        colors = [f"C{i % 10}" for i in range(len(flat_bases))]
         ax.eventplot(flat_bases, orientation='vertical', linelengths=0.5, colors=colors)
 
         if split_by_shell:
             ax.set_xticks(list(range(len(flat_bases))))
-            ax.set_xticklabels([s.l for v in bas.values() for s in v])
+            ax.set_xticklabels([s.l for s in shells])
         else:
             ax.set_xticks(list(range(len(bas))))
             ax.set_xticklabels(list(bas.keys()))
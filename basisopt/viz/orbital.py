@@ -5,6 +5,9 @@ from mayavi import mlab
 from basisopt.containers import Shell
 from basisopt.util import bo_logger
 
+"""Number of z-planes of the grid evaluated at a time in contour3d"""
+_SLAB = 16
+
 
 def contour3d(
     gto: Shell,
@@ -29,10 +32,14 @@ def contour3d(
     Returns:
          the mayavi figure object
     """
-    nj = n * 1j
-    X, Y, Z = np.mgrid[
-        (lower[0]) : (upper[0]) : nj, (lower[1]) : (upper[1]) : nj, (lower[2]) : (upper[2]) : nj
-    ]
-    f = gto.compute(X, Y, Z, i=ix, m=m)
+    # single precision is plenty for display, and halves the size of the grid
+    axes = [np.linspace(lower[d], upper[d], n, dtype=np.float32) for d in range(3)]
+    X, Y, Z = np.meshgrid(*axes, indexing='ij')
+
+    # evaluate in slabs of z-planes, so the temporaries stay small
+    f = np.empty((n, n, n), dtype=np.float32)
+    for zs in range(0, n, _SLAB):
+        sl = np.s_[:, :, zs : zs + _SLAB]
+        f[sl] = gto.compute(X[sl], Y[sl], Z[sl], i=ix, m=m)
     bo_logger.debug("Contour min: %12.6f, max: %12.6f", np.min(f), np.max(f))
     return mlab.contour3d(X, Y, Z, f, contours=contours, colormap='cool', transparent=True)
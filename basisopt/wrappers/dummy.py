@@ -1,5 +1,7 @@
 # Wrappers for testing functionality
-import numpy as np
+import math
+from types import MappingProxyType
+from typing import Optional
 
 from basisopt.molecule import Molecule
 from basisopt.wrappers.wrapper import Wrapper, available
@@ -10,7 +12,7 @@ def _linear(x, a=1.0):
 
 
 def _exp(x, a=1.0):
-    return a * np.exp(a * x)
+    return a * math.exp(a * x)
 
 
 def _quadratic(x, a=1.0):
@@ -22,12 +24,14 @@ def _uniform(x, a=1.0):
 
 
 """Available dummy methods"""
-_method_lookup = {
-    'linear': _linear,
-    'exp': _exp,
-    'quadratic': _quadratic,
-    'uniform': _uniform,
-}
+_method_lookup = MappingProxyType(
+    {
+        'linear': _linear,
+        'exp': _exp,
+        'quadratic': _quadratic,
+        'uniform': _uniform,
+    }
+)
 
 
 class DummyWrapper(Wrapper):
@@ -69,22 +73,27 @@ class DummyWrapper(Wrapper):
         # set basis
         self._basis_value = len(m.basis)
 
+    def _compute(self, mol: Molecule, name: str, a: Optional[float] = None, tmp: str = ""):
+        """Initialises the calculation and evaluates the dummy method,
+        with a defaulting to the number of elements in the basis
+        """
+        self.initialise(mol, name=name, tmp=tmp)
+        if a is None:
+            a = self._basis_value
+        return _method_lookup[mol.method](self._value, a=a)
+
     @available
     def energy(self, mol, tmp=""):
-        self.initialise(mol, name="energy", tmp=tmp)
-        return _method_lookup[mol.method](self._value, a=-1.0)
+        return self._compute(mol, "energy", a=-1.0, tmp=tmp)
 
     @available
     def dipole(self, mol, tmp=""):
-        self.initialise(mol, name="dipole", tmp=tmp)
-        return _method_lookup[mol.method](self._value, a=0.5)
+        return self._compute(mol, "dipole", a=0.5, tmp=tmp)
 
     @available
     def quadrupole(self, mol, tmp=""):
-        self.initialise(mol, name="quadrupole", tmp=tmp)
-        return _method_lookup[mol.method](self._value, a=0.1)
+        return self._compute(mol, "quadrupole", a=0.1, tmp=tmp)
 
     @available
     def polarizability(self, mol, tmp=""):
-        self.initialise(mol, name="polarizability", tmp=tmp)
-        return _method_lookup[mol.method](self._value, a=self._basis_value)
+        return self._compute(mol, "polarizability", tmp=tmp)
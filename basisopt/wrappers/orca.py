@@ -1,23 +1,84 @@
 # Wrappers for psi4 functionality
+import functools
 import os
+import re
+import shutil
 import subprocess
+import tempfile
+from collections import OrderedDict
 from typing import Any
 
-import mendeleev as md
 import numpy as np
 
-from basisopt.bse_wrapper import internal_basis_converter
+from basisopt.bse_wrapper import basis_fingerprint, internal_basis_converter
 from basisopt.containers import InternalBasis
-from basisopt.exceptions import FailedCalculation
+from basisopt.exceptions import FailedCalculation, MethodNotAvailable
 from basisopt.molecule import Molecule
+from basisopt.util import bo_logger
 from basisopt.wrappers.wrapper import Wrapper, available
 
+"""Matches the element name lines that start each atom in a GAMESS-US basis"""
+_ELEMENT_LINE = re.compile(r"^[ \t]*(\S+)[ \t]*$", re.MULTILINE)
+
+"""Maximum number of converted basis blocks kept by each OrcaWrapper"""
+_BASIS_CACHE_SIZE = 128
+
+"""The %elprop keyword and property file name for each electric property"""
+_ELECTRIC_PROPERTIES = {
+    'dipole': ('dipole', 'Total Dipole moment'),
+    'quadrupole': ('quadrupole', 'Total quadrupole moment'),
+    'polarizability': ('polar', 'Isotropic polarizability'),
+}
+
+"""Property file entry holding the total energy"""
+_ENERGY_STRING = "Calculation_Info:Total Energy"
+
+
+@functools.lru_cache(maxsize=None)
+def _element_symbol(name: str) -> str:
+    """Looks up the symbol for an element name, cached as mendeleev queries a database"""
+    from mendeleev import element as md_element
+
+    return md_element(name.title()).symbol
+
+
+@functools.lru_cache(maxsize=64)
+def _search_modules(search_strings: tuple[str, ...]) -> dict[str, dict[str, None]]:
+    """Breaks search strings of the form "{block}:{property}" up by block;
+    the names are kept as dict keys so that lookups are O(1) while the order
+    of the search is preserved. Cached, as the same few searches are made
+    after every calculation, so the result must not be modified.
+    """
+    modules = {}
+    for s in search_strings:
+        block, _, name = s.partition(':')
+        modules.setdefault(block, {})[name] = None
+    return modules
+
+
+def _electric_property(name: str, lines: list[str], ix: int) -> Any:
+    """Parses an electric property from an orca property file,
+    where the property name is on line ix
+    """
+    if "Dipole" in name:
+        # 3D vector
+        return np.array([line.split()[1] for line in lines[ix + 2 : ix + 5]], dtype=float)
+    elif "quadrupole" in name:
+        # 3x3 matrix
+        return np.array([line.split()[1:] for line in lines[ix + 2 : ix + 5]], dtype=float)
+    elif "polarizability" in name:
+        # currently taking the isotropic polarizability
+        # could change to take raw tensor
+        return lines[ix].split(':')[1].strip()
+    return None
+
 
 class OrcaWrapper(Wrapper):
     """Wrapper for Orca 5
 
     Private attribute:
-         pwd (str): the present working directory
+         basis_cache (OrderedDict): LRU cache of converted basis blocks,
+             keyed by basis fingerprint and gto string
     """
 
     def __init__(self, orca_path: str):
@@ -42,21 +103,18 @@ class OrcaWrapper(Wrapper):
             'casscf': ['energy', 'trans_dipole', 'trans_quadrupole'],
             'rasscf': ['energy', 'trans_dipole', 'trans_quadrupole'],
         }
-        self._pwd = "."
+        # command line headers for every method other than dft, which needs a functional
+        self._commands = {m: f"! {m.upper()} " for m in self._method_strings if m != 'dft'}
+        self._basis_cache = OrderedDict()
 
     def convert_molecule(self, m: Molecule) -> str:
         """Convert an internal Molecule object
         to an Orca geometry section
         """
-        molstring = f"* xyz {m.charge} {m.multiplicity}\n"
-        for i in range(m.natoms()):
-            if i in m.dummy_atoms:
-                suffix = ":"
-            else:
-                suffix = ""
-            molstring += m.get_line(i, atom_suffix=suffix) + "\n"
-        molstring += "*\n"
-        return molstring
+        lines = [f"* xyz {m.charge} {m.multiplicity}"]
+        lines.extend(m.get_lines(dummy_suffix=":"))
+        lines.append("*\n")
+        return "\n".join(lines)
 
     def _density_prefix(self, method: str) -> str:
         """Grabs the prefix for density options
@@ -73,31 +131,27 @@ class OrcaWrapper(Wrapper):
         name into an ORCA command line
         """
         if method == "dft":
-            if "functional" in params:
-                func = params["functional"]
-                command = f"! {func} "
-            else:
+            if "functional" not in params:
                 raise KeyError("DFT functional not specified")
+            parts = [f"! {params['functional']} "]
         else:
-            command = f"! {method.upper()} "
+            parts = [self._commands.get(method) or f"! {method.upper()} "]
 
         if "command_line" in params:
-            command += params["command_line"]
+            parts.append(params["command_line"])
 
         if "density" in params:
             prefix = self._density_prefix(method)
             if prefix:
-                command += f"\n%{prefix}\n"
-                command += "density\t" + params["density"]
-                command += "\nend"
+                parts.append(f"\n%{prefix}\ndensity\t{params['density']}\nend")
 
         if "elprop" in params:
-            command += "\n%elprop\n"
-            for line in params["elprop"]:
-                command += line + "\n"
-            command += "end"
+            parts.append("\n%elprop\n")
+            parts.extend(line + "\n" for line in params["elprop"])
+            parts.append("end")
 
-        return command + "\n"
+        parts.append("\n")
+        return "".join(parts)
 
     def _convert_basis(self, basis: InternalBasis, gto_string: str = "NewGTO") -> str:
         """Converts an InternalBasis to the basis string for ORCA 5
@@ -110,27 +164,28 @@ class OrcaWrapper(Wrapper):
         Returns:
             orca basis block string
         """
-        gamess_basis = internal_basis_converter(basis, fmt="gamess_us").split("\n")
-        first_atom = True
-        basis_str = ""
-        for line in gamess_basis[2:-1]:
-            words = line.split()
-            if len(words) == 1:
-                if first_atom:
-                    first_atom = False
-                else:
-                    basis_str += "end\n"
-                atom = md.element(line.strip().title()).symbol
-                basis_str += f"{gto_string} {atom}\n"
-            else:
-                basis_str += line + "\n"
-        basis_str += "end\n"
+        key = (basis_fingerprint(basis), gto_string)
+        if key in self._basis_cache:
+            self._basis_cache.move_to_end(key)
+            return self._basis_cache[key]
+
+        # drop the two header lines and the trailing line, then swap each
+        # element name line for an ORCA block header in a single pass
+        gamess_basis = internal_basis_converter(basis, fmt="gamess_us")
+        body = gamess_basis.partition("\n")[2].partition("\n")[2].rpartition("\n")[0]
+        body = _ELEMENT_LINE.sub(
+            lambda match: f"end\n{gto_string} {_element_symbol(match.group(1))}", body
+        )
+        basis_str = body.removeprefix("end\n") + "\nend\n" if body else "end\n"
+
+        self._basis_cache[key] = basis_str
+        if len(self._basis_cache) > _BASIS_CACHE_SIZE:
+            self._basis_cache.popitem(last=False)
         return basis_str
 
     def initialise(self, m: Molecule, name: str = "", tmp: str = ".", **params) -> str:
-        """Initialises Orca and creates input file for calculation.
-        WARNING: moves to the scratch directory, but saves PWD in
-                self._pwd
+        """Initialises Orca and creates input file for calculation
+        in a new run directory inside the scratch directory
 
         Arguments:
                 m (Molecule): molecule to run calculation on
@@ -138,33 +193,32 @@ class OrcaWrapper(Wrapper):
                 tmp (str): path to scratch directory
 
         Returns:
-                the prefix for the calculation input/output files
+                the prefix for the calculation input/output files,
+                including the path to the run directory
         """
         # create input file
-        self._pwd = os.getenv("PWD")
-        os.chdir(tmp)
-        prefix = f"{m.name}-{m.method}-" + name
+        # each calculation gets its own directory, so that concurrent runs
+        # never share files and cleaning up is a single tree removal
+        run_dir = tempfile.mkdtemp(prefix="orca-", dir=tmp or ".")
+        prefix = os.path.join(run_dir, f"{m.name}-{m.method}-" + name)
 
         # handle options, molecule, basis
         cmd = self._command_string(m.method, **params)
         mol = self.convert_molecule(m)
 
-        basis = "%basis\n"
-        for atom, ecp in m.ecps.items():
-            basis += f'newECP {atom.title()} "{ecp}" end\n'
-        basis += self._convert_basis(m.basis)
+        parts = [cmd, mol, "%basis\n"]
+        parts.extend(f'newECP {atom.title()} "{ecp}" end\n' for atom, ecp in m.ecps.items())
+        parts.append(self._convert_basis(m.basis))
 
         if m.jkbasis:
-            basis += self._convert_basis(m.jkbasis, gto_string="NewAuxJKGTO")
+            parts.append(self._convert_basis(m.jkbasis, gto_string="NewAuxJKGTO"))
         elif m.jbasis:
-            basis += self._convert_basis(m.jbasis, gto_string="NewAuxJGTO")
-        basis += "end\n"
+            parts.append(self._convert_basis(m.jbasis, gto_string="NewAuxJGTO"))
+        parts.append("end\n")
 
         # write to file
         with open(f"{prefix}.inp", 'w', encoding='utf-8') as f:
-            f.write(cmd)
-            f.write(mol)
-            f.write(basis)
+            f.write("".join(parts))
 
         return prefix
 
@@ -172,11 +226,14 @@ class OrcaWrapper(Wrapper):
         """Run an ORCA executable
 
         Arguments:
-               prefix (str): prefix for input/output files
+               prefix (str): prefix for input/output files, as from initialise
                program (str): the orca executable to use
         """
-        run_cmd = f"{self._path}/{program} {prefix}.inp > {prefix}.out"
-        subprocess.run(run_cmd, shell=True, check=True)
+        # run from the scratch directory, as ORCA writes its files next to the input
+        tmp, name = os.path.split(prefix)
+        run_cmd = [os.path.join(self._path, program), f"{name}.inp"]
+        with open(f"{prefix}.out", 'w', encoding='utf-8') as out:
+            subprocess.run(run_cmd, stdout=out, cwd=tmp or None, check=True)
 
     def _read_property_file(self, prefix: str, search_strings: list[str]) -> dict[str, Any]:
         """Reads in desired results from the orca [name]_property.txt file.
@@ -191,29 +248,23 @@ class OrcaWrapper(Wrapper):
         Returns:
             a dictionary of {search_string}:{value}
         """
-        # read in the property file
         with open(f"{prefix}_property.txt", 'r') as f:
             lines = f.readlines()
+        return self._parse_property_lines(lines, search_strings)
 
-        # break the search strings up by module
-        modules = {}
-        special_keys = []
-        for s in search_strings:
-            words = s.split(':')
-            if words[0] not in modules:
-                if "Electric_Properties" in words[0]:
-                    # Dipoles/Quadrupoles are vectors/matrices
-                    special_keys.append(words[0])
-                modules[words[0]] = []
-            modules[words[0]].append(words[1])
+    def _parse_property_lines(self, lines: list[str], search_strings: list[str]) -> dict[str, Any]:
+        """Looks up results in the lines of an orca [name]_property.txt file,
+        see _read_property_file
+        """
+        modules = _search_modules(tuple(search_strings))
 
-        # Go through the property file tracking down the
+        # Go through the property file once, tracking down the
         # modules and properties in modules dict
         current_module = ""
         results = {k: None for k in search_strings}
         for ix, line in enumerate(lines):
             if "$" in line:
-                current_module = line.split()[1].strip()
+                current_module = line.split(maxsplit=2)[1]
             elif ("#" in line) or ("---" in line):
                 current_module = ""
             elif current_module in modules:
@@ -221,62 +272,32 @@ class OrcaWrapper(Wrapper):
                 # while others just have a space, because ORCA is horribly
                 # inconsistent about how it prints things out
                 if ':' in line:
-                    words = line.split(':')
-                    name = words[0].strip()
-                    key = f"{current_module}:{name}"
-                    if name in modules[current_module]:
-                        if "Electric_Properties" in current_module:
-                            # place the line index so that subsequent
-                            # lines can be parsed
-                            results[key] = ix
-                        else:
-                            results[key] = words[1].strip()
+                    name, _, result = line.partition(':')
+                    name = name.strip()
+                    if name not in modules[current_module]:
+                        continue
+                    result = result.split(':', 1)[0].strip()
                 else:
-                    for name in modules[current_module]:
-                        if name in line:
-                            key = f"{current_module}:{name}"
-                            if "Electric_Properties" in current_module:
-                                results[key] = ix
-                            else:
-                                result = line.replace(name, "").strip()
-                                results[key] = result
-                            break
-
-        # to grab electric properties, we need to reloop over
-        # certain lines
-        for key in special_keys:
-            module = modules[key]
-            for name in module:
-                line_ix = results[f"{key}:{name}"]
-                if "Dipole" in name:
-                    # 3D vector
-                    res = np.zeros(3)
-                    for i, line in enumerate(lines[line_ix + 2 : line_ix + 5]):
-                        res[i] = float(line.split()[1])
-                elif "quadrupole" in name:
-                    # 3x3 matrix
-                    res = np.zeros([3, 3])
-                    for i, line in enumerate(lines[line_ix + 2 : line_ix + 5]):
-                        row = [float(w) for w in line.split()[1:]]
-                        res[i] = np.array(row)
-                elif "polarizability" in name:
-                    # currently taking the isotropic polarizability
-                    # could change to take raw tensor
-                    line = lines[line_ix]
-                    res = line.split(':')[1].strip()
-                results[f"{key}:{name}"] = res
+                    name = next((n for n in modules[current_module] if n in line), None)
+                    if name is None:
+                        continue
+                    result = line.replace(name, "").strip()
+
+                if "Electric_Properties" in current_module:
+                    # Dipoles/Quadrupoles are vectors/matrices
+                    # printed on the lines that follow
+                    result = _electric_property(name, lines, ix)
+                results[f"{current_module}:{name}"] = result
 
         return results
 
     def _internal_clean(self, prefix: str):
-        """Cleans up ORCA run files, and returns to previous PWD
+        """Cleans up ORCA run files, by removing the run directory
 
         Arguments:
-             prefix (str): the prefix for the orca run files
+             prefix (str): the prefix for the orca run files, as from initialise
         """
-        run_cmd = f"rm {prefix}*"
-        subprocess.run(run_cmd, shell=True, check=True)
-        os.chdir(self._pwd)
+        shutil.rmtree(os.path.dirname(prefix), ignore_errors=True)
 
     def _property_calc(
         self, mol: Molecule, search_string: str, density_needed: bool, tmp: str, **params
@@ -298,6 +319,21 @@ class OrcaWrapper(Wrapper):
         Raises:
             FailedCalculation
         """
+        results = self._property_calcs(mol, [search_string], density_needed, tmp, **params)
+        return results[search_string]
+
+    def _property_calcs(
+        self, mol: Molecule, search_strings: list[str], density_needed: bool, tmp: str, **params
+    ) -> dict[str, Any]:
+        """Run a single ORCA calculation and look up several properties,
+        see _property_calc
+
+        Returns:
+            a dictionary of {search_string}:{value}
+
+        Raises:
+            FailedCalculation if any of the properties are not found
+        """
         if density_needed:
             if "density" not in params:
                 if "mp2" in mol.method:
@@ -306,17 +342,81 @@ class OrcaWrapper(Wrapper):
                     params["density"] = "linearized"
         name = params.get("jobname", "energy")
         prefix = self.initialise(mol, tmp=tmp, name=name, **params)
-        self._run_orca(prefix)
-        results = self._read_property_file(prefix, [search_string])
-        self._internal_clean(prefix)
-        if results[search_string] is None:
+
+        try:
+            self._run_orca(prefix)
+            results = self._read_property_file(prefix, search_strings)
+        finally:
+            self._internal_clean(prefix)
+        if any(v is None for v in results.values()):
             raise FailedCalculation
-        return results[search_string]
+        return results
+
+    def properties(
+        self, mol: Molecule, props: list[str], tmp: str = "", **params
+    ) -> dict[str, Any]:
+        """Calculates several electric properties, and optionally the energy,
+        from a single ORCA run, rather than one run per property as when
+        calling e.g. dipole and polarizability separately
+
+        Arguments:
+            mol (Molecule): molecule to run calculation on
+            props (list): properties wanted, any of 'energy', 'dipole',
+                'quadrupole' and 'polarizability'
+            tmp (str): path to the scratch directory
+            params: any parameters for the calculation, as for dipole etc.
+
+        Returns:
+            a dictionary of {property}:{value}
+
+        Raises:
+            MethodNotAvailable, FailedCalculation
+        """
+        for p in props:
+            known = p == 'energy' or p in _ELECTRIC_PROPERTIES
+            if not known or not self.verify_method_string(f"{mol.method}.{p}"):
+                raise MethodNotAvailable(f"{mol.method}.{p}")
+
+        electric = [p for p in props if p != 'energy']
+        if "elprop" not in params and electric:
+            params["elprop"] = [f"{_ELECTRIC_PROPERTIES[p][0]}\ttrue" for p in electric]
+        block = (self._density_prefix(mol.method) or "scf").upper() + "_Electric_Properties"
+        search_strings = [
+            _ENERGY_STRING if p == 'energy' else f"{block}:{_ELECTRIC_PROPERTIES[p][1]}"
+            for p in props
+        ]
+        results = self._property_calcs(mol, search_strings, bool(electric), tmp, **params)
+        values = {p: results[s] for p, s in zip(props, search_strings)}
+        if 'energy' in values:
+            values['energy'] = float(values['energy'])
+        return values
+
+    def run_many(
+        self, evaluates: list[str], molecule: Molecule, params: dict[str, Any], tmp: str = ""
+    ) -> int:
+        """Runs several properties in one ORCA calculation where possible,
+        see Wrapper.run_many and properties
+        """
+        props = [e.lower() for e in evaluates]
+        batchable = all(p == 'energy' or p in _ELECTRIC_PROPERTIES for p in props)
+        if not batchable or all(p == 'energy' for p in props):
+            return super().run_many(evaluates, molecule, params, tmp=tmp)
+
+        try:
+            values = self.properties(molecule, props, tmp=tmp, **params)
+        except KeyError as e:
+            bo_logger.error(e)
+            return -2
+        except MethodNotAvailable as e:
+            bo_logger.error("Unable to run %s with %s backend", e, self._name)
+            return -1
+        for e, p in zip(evaluates, props):
+            self._values[e] = values[p]
+        return 0
 
     @available
     def energy(self, mol, tmp="", **params):
-        search_string = "Calculation_Info:Total Energy"
-        result = self._property_calc(mol, search_string, False, tmp, **params)
+        result = self._property_calc(mol, _ENERGY_STRING, False, tmp, **params)
         return float(result)
 
     @available
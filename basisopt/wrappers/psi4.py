@@ -1,4 +1,5 @@
 # Wrappers for psi4 functionality
+import functools
 from typing import Any
 
 import psi4
@@ -7,8 +8,32 @@ from basis_set_exchange.writers import write_formatted_basis_str
 from basisopt.bse_wrapper import fetch_ecp, internal_basis_converter
 from basisopt.exceptions import EmptyCalculation, PropertyNotAvailable
 from basisopt.molecule import Molecule
+from basisopt.util import bo_logger
 from basisopt.wrappers.wrapper import Wrapper, available
 
+"""Properties that psi4.properties can calculate together from one wavefunction"""
+_WFN_PROPERTIES = frozenset({'dipole', 'quadrupole', 'polarizability'})
+
+"""Methods whose properties Psi4 stores under the SCF and CI prefixes"""
+_SCF_METHODS = frozenset({'scf', 'hf'})
+_CI_METHODS = frozenset({'cisd'})
+
+
+@functools.lru_cache(maxsize=64)
+def _ecp_string(atom: str, name: str) -> str:
+    """Fetches an ECP from the BSE and formats it for Psi4; cached, as
+    the same ECPs are needed for every calculation on a molecule
+    """
+    ecp = fetch_ecp(name, [atom])
+    lines = write_formatted_basis_str(ecp, fmt="psi4").split('\n')
+    return "\n".join(lines[4:])
+
+
+@functools.lru_cache(maxsize=64)
+def _variable_names(ptype: str, properties: tuple[str, ...]) -> tuple[str, ...]:
+    """Names of the Psi4 wavefunction variables holding the given properties"""
+    return tuple(f"{ptype} {p.upper()}" for p in properties)
+
 
 class Psi4Wrapper(Wrapper):
     """Wrapper for Psi4"""
@@ -43,13 +68,7 @@ class Psi4Wrapper(Wrapper):
         """Convert an internal Molecule object
         to a Psi4 Molecule object
         """
-        molstring = ""
-        for i in range(m.natoms()):
-            if i in m.dummy_atoms:
-                prefix = "@"
-            else:
-                prefix = ""
-            molstring += m.get_line(i, atom_prefix=prefix) + "\n"
+        molstring = "".join(line + "\n" for line in m.get_lines(dummy_prefix="@"))
         return psi4.geometry(molstring)
 
     def _property_prefix(self, method: str) -> str:
@@ -57,9 +76,9 @@ class Psi4Wrapper(Wrapper):
         psi4.properties
         """
         m = method.lower()
-        if m in ['scf', 'hf']:
+        if m in _SCF_METHODS:
             return 'SCF'
-        elif m in ['cisd']:
+        elif m in _CI_METHODS:
             return 'CI'
         return method.upper()
 
@@ -107,11 +126,7 @@ class Psi4Wrapper(Wrapper):
         # set basis
         g94_basis = internal_basis_converter(m.basis, fmt="psi4")
         # add any ecp bases
-        ecp_string = "\n"
-        for atom, name in m.ecps.items():
-            ecp = fetch_ecp(name, [atom])
-            lines = write_formatted_basis_str(ecp, fmt="psi4").split('\n')
-            ecp_string += "\n".join(lines[4:])
+        ecp_string = "\n" + "".join(_ecp_string(atom, name) for atom, name in m.ecps.items())
         psi4.basis_helper(g94_basis + ecp_string)
 
     def clean(self):
@@ -119,7 +134,12 @@ class Psi4Wrapper(Wrapper):
         psi4.core.clean()
 
     def _get_properties(
-        self, mol: Molecule, name: str = "prop", properties: list[str] = [], tmp: str = "", **params
+        self,
+        mol: Molecule,
+        name: str = "prop",
+        properties: tuple[str, ...] = (),
+        tmp: str = "",
+        **params,
     ) -> dict[str, Any]:
         """Helper function to retrieve a property value from Psi4
         after a calculation.
@@ -128,24 +148,53 @@ class Psi4Wrapper(Wrapper):
         if ptype == "DFT":
             func = params['functional']
             ptype = func.upper()
-        strings = [ptype + " " + p.upper() for p in properties]
+        strings = _variable_names(ptype, tuple(properties))
 
         if len(strings) == 0:
             raise EmptyCalculation
 
         self.initialise(mol, name=name, tmp=tmp, **params)
         runstring = self._command_string(mol.method, **params)
-        _, wfn = psi4.properties(runstring, return_wfn=True, properties=properties)
+        _, wfn = psi4.properties(runstring, return_wfn=True, properties=list(properties))
 
         results = {}
+        variables = wfn.variables()
         for p, s in zip(properties, strings):
-            if s in wfn.variables():
+            if s in variables:
                 results[p] = wfn.variable(s)
             else:
                 raise PropertyNotAvailable(p)
 
         return results
 
+    def run_many(
+        self, evaluates: list[str], molecule: Molecule, params: dict[str, Any], tmp: str = ""
+    ) -> int:
+        """Runs the dipole, quadrupole and polarizability together with a single
+        psi4.properties call where possible, and anything else one at a time;
+        see Wrapper.run_many
+        """
+        name = molecule.method.lower()
+        available = self._method_strings.get(name, ())
+        batch = [e for e in evaluates if e in _WFN_PROPERTIES and e in available]
+        if len(batch) < 2:
+            return super().run_many(evaluates, molecule, params, tmp=tmp)
+
+        try:
+            self._values.update(
+                self._get_properties(
+                    molecule, name="props", properties=tuple(batch), tmp=tmp, **params
+                )
+            )
+        except KeyError as e:
+            bo_logger.error(e)
+            return -2
+        except PropertyNotAvailable as e:
+            bo_logger.error("Unable to run %s.%s with %s backend", name, e, self._name)
+            return -1
+        rest = [e for e in evaluates if e not in batch]
+        return super().run_many(rest, molecule, params, tmp=tmp)
+
     @available
     def energy(self, mol, tmp="", **params):
         self.initialise(mol, name="energy", tmp=tmp, **params)
@@ -154,19 +203,21 @@ class Psi4Wrapper(Wrapper):
 
     @available
     def dipole(self, mol, tmp="", **params):
-        results = self._get_properties(mol, name="dipole", properties=['dipole'], tmp=tmp, **params)
+        results = self._get_properties(
+            mol, name="dipole", properties=('dipole',), tmp=tmp, **params
+        )
         return results['dipole']
 
     @available
     def quadrupole(self, mol, tmp="", **params):
         results = self._get_properties(
-            mol, name="quadrupole", properties=['quadrupole'], tmp=tmp, **params
+            mol, name="quadrupole", properties=('quadrupole',), tmp=tmp, **params
         )
         return results['quadrupole']
 
     @available
     def polarizability(self, mol, tmp="", **params):
         results = self._get_properties(
-            mol, name="polar", properties=['polarizability'], tmp=tmp, **params
+            mol, name="polar", properties=('polarizability',), tmp=tmp, **params
         )
         return results['polarizability']
@@ -49,9 +49,11 @@ class Wrapper:
         _globals (dict): dictionary of parameters that should be set every time
         a calculation is run, e.g. {'memory': '2gb', ...}. These should be parsed
         as part of the 'run' function in every Child implementation
+        _session (bool): True while a session is open, see begin_session
 
     Attributes that should only be set here:
         _methods (dict): dictionary of all possible calculation types, pointing to member funcs
+        _available_calcs (frozenset): names of the calculation types marked as available
     """
 
     def __init__(self, name: str = 'Empty'):
@@ -66,11 +68,14 @@ class Wrapper:
             'polarizability': self.polarizability,
             'jk_error': self.jk_error,
         }
+        # availability is fixed by the decorators on the class, so find it once
+        self._available_calcs = frozenset(k for k, v in self._methods.items() if v._available)
 
         self._method_strings = {}
 
         self._values = {}
         self._globals = {}
+        self._session = False
 
     def add_global(self, name: str, value: Any):
         """Add a global option"""
@@ -82,6 +87,10 @@ class Wrapper:
             return self._values[name]
         return None
 
+    def set_value(self, name: str, value: Any):
+        """Store a data point, as if it had just been calculated"""
+        self._values[name] = value
+
     def verify_method_string(self, string: str) -> bool:
         """Checks whether a method is available with this wrapper
 
@@ -95,22 +104,30 @@ class Wrapper:
         Raises:
              InvalidMethodString
         """
-        parts = string.split('.')
-        if len(parts) < 2:
+        name, sep, rest = string.partition('.')
+        if not sep:
             raise InvalidMethodString
 
-        name = parts[0]
-        method = parts[1]
-        available = name in self._method_strings
-        if available:
-            methods = self._method_strings[name]
-            available = method in methods
-        return available
+        method = rest.partition('.')[0]
+        return method in self._method_strings.get(name, ())
 
     def clean(self):
         """Cleans up any temporary files"""
         pass
 
+    def begin_session(self):
+        """Starts a session for a series of closely related calculations, e.g.
+        the same molecule with slightly different basis sets. Until end_session
+        is called, clean is not called between calculations, so backends can
+        reuse any scratch data they leave behind.
+        """
+        self._session = True
+
+    def end_session(self):
+        """Ends a session started with begin_session, and cleans up"""
+        self._session = False
+        self.clean()
+
     def run(self, evaluate: str, molecule: Molecule, params: dict[str, Any], tmp: str = "") -> int:
         """Runs a calculation with this backend
         MUST BE IMPLEMENTED IN ALL WRAPPERS
@@ -124,30 +141,49 @@ class Wrapper:
         Returns:
              0 on success, -1 if method isn't available, -2 otherwise
         """
-        method_str = f"{molecule.method}.{evaluate}".lower()
+        # same check as verify_method_string, without building and re-parsing a string
+        name, prop = molecule.method.lower(), evaluate.lower()
         try:
-            if self.verify_method_string(method_str):
+            if prop in self._method_strings.get(name, ()):
                 self._values[evaluate] = self._methods[evaluate](molecule, tmp=tmp, **params)
                 return 0
-            raise MethodNotAvailable(method_str)
+            raise MethodNotAvailable(f"{name}.{prop}")
         except KeyError as e:
             bo_logger.error(e)
             return -2
         except MethodNotAvailable:
-            bo_logger.error("Unable to run %s with %s backend", method_str, self._name)
+            bo_logger.error("Unable to run %s.%s with %s backend", name, prop, self._name)
             return -1
 
+    def run_many(
+        self, evaluates: list[str], molecule: Molecule, params: dict[str, Any], tmp: str = ""
+    ) -> int:
+        """Runs calculations of several properties of the same molecule, storing
+        each in _values. This runs them one at a time; wrappers for backends that
+        can get several properties from a single calculation override it.
+
+        Arguments:
+             evaluates (list): the properties to evaluate, e.g. ['energy', 'dipole']
+             molecule: a Molecule object to run the calculations on
+             params (dict): any parameters for the calculation in addition to _globals
+             tmp (str): path to scratch directory
+
+        Returns:
+             0 on success, otherwise the code from the first failed run
+        """
+        for evaluate in evaluates:
+            result = self.run(evaluate, molecule, params, tmp=tmp)
+            if result != 0:
+                return result
+        return 0
+
     def method_is_available(self, method: str = 'energy') -> bool:
         """Returns True if a calculation type is available, false otherwise"""
-        try:
-            func = self._methods[method]
-            return func._available
-        except KeyError:
-            return False
+        return method in self._available_calcs
 
     def all_available(self) -> list[str]:
         """Returns a list of all available calculation types"""
-        return [k for k, v in self._methods.items() if v._available]
+        return [k for k in self._methods if k in self._available_calcs]
 
     def available_properties(self, name: str) -> list[str]:
         """Returns a list of all available calculation types for a
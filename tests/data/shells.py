@@ -1,6 +1,7 @@
 import numpy as np
 
 from basisopt.containers import Shell
+from basisopt.molecule import Molecule
 
 _nsexp = 4
 _nsfuncs = 2
@@ -37,6 +38,14 @@ def get_vdz_internal():
     return {'h': [s_shell, p_shell]}
 
 
+def h_atom():
+    m = Molecule(name="H_atom")
+    m.add_atom()
+    m.method = "linear"
+    m.basis = get_vdz_internal()
+    return m
+
+
 def shells_are_equal(s1, s2):
     equal = s1.l == s2.l
     equal &= np.sum(np.abs(s1.exps - s2.exps)) == 0
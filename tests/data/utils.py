@@ -1,5 +1,31 @@
+from collections import OrderedDict
+
 import numpy as np
 
+from basisopt import api
+
 
 def almost_equal(x, y, thresh=1e-12):
     return np.abs(x - y) < thresh
+
+
+def count_energy_calls(monkeypatch):
+    """Sets the dummy backend and returns a list that gets an entry for each
+    energy it actually calculates; the api result cache is reset afterwards
+    """
+    api.set_backend("dummy")
+    backend = api.get_backend()
+    calls = []
+    energy = backend._methods['energy']
+    monkeypatch.setitem(
+        backend._methods, 'energy', lambda mol, **kwargs: calls.append(1) or energy(mol, **kwargs)
+    )
+    monkeypatch.setattr(api, "_RESULT_CACHE_SIZE", api._RESULT_CACHE_SIZE)
+    monkeypatch.setattr(api, "_RESULT_CACHE_FILE", api._RESULT_CACHE_FILE)
+    monkeypatch.setattr(api, "_result_cache", OrderedDict())
+    return calls
+
+
+def serial_distribute(n_proc, func, x, **kwargs):
+    """Stand-in for parallelise.distribute that runs everything in this process"""
+    return [func(v, **kwargs) for v in x]
@@ -1,8 +1,12 @@
 import logging
 import os
 
-from basisopt import api
+import numpy as np
+
+from basisopt import api, parallelise
 from basisopt.wrappers import Wrapper
+from tests.data.shells import h_atom
+from tests.data.utils import count_energy_calls, serial_distribute
 
 
 def test_backend_registration():
@@ -48,3 +52,130 @@ def test_set_logger():
 
     api.set_logger(level=logging.WARNING)
     assert logger.getEffectiveLevel() == logging.WARNING
+
+
+def test_backend_session():
+    api.set_backend("dummy")
+    with api.backend_session() as backend:
+        assert backend is api.get_backend()
+        assert backend._session
+    assert not api.get_backend()._session
+
+
+def test_calculation_key():
+    m = h_atom()
+    key = api.calculation_key(m, "energy", {})
+    assert key == api.calculation_key(h_atom(), "energy", {})
+    assert key != api.calculation_key(m, "dipole", {})
+    assert key != api.calculation_key(m, "energy", {"memory": "1gb"})
+
+    m.basis['h'][0].exps[0] = 12.0
+    assert key != api.calculation_key(m, "energy", {})
+
+    # large arrays differing only in the middle, which repr would elide
+    a, b = np.zeros(10000), np.zeros(10000)
+    b[5000] = 1.0
+    key = api.calculation_key(m, "energy", {"guess": a})
+    assert key == api.calculation_key(m, "energy", {"guess": a.copy()})
+    assert key != api.calculation_key(m, "energy", {"guess": b})
+    assert key != api.calculation_key(m, "energy", {"guess": [a]})
+
+
+def test_result_cache(monkeypatch):
+    calls = count_energy_calls(monkeypatch)
+    backend = api.get_backend()
+    api.set_result_cache(4)
+    m = h_atom()
+    assert api.run_calculation(evaluate='energy', mol=m) == 0
+    value = backend.get_value('energy')
+    assert api.run_calculation(evaluate='energy', mol=h_atom()) == 0
+    assert backend.get_value('energy') == value
+    assert len(calls) == 1
+
+    m.basis['h'][0].exps[0] = 12.0
+    api.run_calculation(evaluate='energy', mol=m)
+    assert len(calls) == 2
+
+    api.set_result_cache(0)
+    api.run_calculation(evaluate='energy', mol=m)
+    assert len(calls) == 3
+
+
+def test_result_cache_copies_arrays(monkeypatch):
+    api.set_backend("dummy")
+    backend = api.get_backend()
+    monkeypatch.setitem(backend._methods, 'dipole', lambda mol, **kwargs: np.array([0.0, 0.0, 1.0]))
+    api.set_result_cache(4)
+    try:
+        m = h_atom()
+        api.run_calculation(evaluate='dipole', mol=m)
+        backend.get_value('dipole')[2] = 5.0
+        api.run_calculation(evaluate='dipole', mol=m)
+        dipole = backend.get_value('dipole')
+        assert np.array_equal(dipole, [0.0, 0.0, 1.0])
+
+        dipole[2] = 5.0
+        api.run_calculation(evaluate='dipole', mol=m)
+        assert np.array_equal(backend.get_value('dipole'), [0.0, 0.0, 1.0])
+    finally:
+        api.set_result_cache(0)
+
+
+def test_result_cache_file(monkeypatch, tmp_path):
+    calls = count_energy_calls(monkeypatch)
+    backend = api.get_backend()
+    filename = str(tmp_path / "results.sqlite")
+    api.set_result_cache(4, filename=filename)
+    api.run_calculation(evaluate='energy', mol=h_atom())
+    value = backend.get_value('energy')
+    assert len(calls) == 1
+
+    # a new in-memory cache, as in a fresh run, still finds the result
+    api.set_result_cache(4, filename=filename)
+    backend._values.clear()
+    assert api.run_calculation(evaluate='energy', mol=h_atom()) == 0
+    assert backend.get_value('energy') == value
+    assert len(calls) == 1
+
+    api.clear_result_cache()
+    api.run_calculation(evaluate='energy', mol=h_atom())
+    assert len(calls) == 2
+
+
+def test_run_calculations():
+    api.set_backend("dummy")
+    backend = api.get_backend()
+    calls = []
+    run_many = backend.run_many
+    backend.run_many = lambda evaluates, *args, **kwargs: calls.append(evaluates) or run_many(
+        evaluates, *args, **kwargs
+    )
+    try:
+        api.set_result_cache(4)
+        m = h_atom()
+        assert api.run_calculation(evaluate='energy', mol=m) == 0
+        assert api.run_calculations(evaluates=['energy', 'dipole', 'quadrupole'], mol=m) == 0
+        assert calls == [['dipole', 'quadrupole']]
+        assert backend.get_value('dipole') is not None
+    finally:
+        del backend.run_many
+        api.set_result_cache(0)
+
+
+def test_run_all_parallel_result_cache(monkeypatch):
+    calls = count_energy_calls(monkeypatch)
+    monkeypatch.setattr(api, "_PARALLEL", True)
+    monkeypatch.setattr(parallelise, "distribute", serial_distribute)
+    api.set_result_cache(4)
+    m1 = h_atom()
+    m2 = h_atom()
+    m2.name = "H_atom2"
+    m2.basis['h'][0].exps[0] = 12.0
+    api.run_calculation(evaluate='energy', mol=m1)
+    assert len(calls) == 1
+
+    results = api.run_all(evaluate='energy', mols=[m1, m2], parallel=True)
+    assert len(calls) == 2
+    assert set(results) == {"H_atom", "H_atom2"}
+    api.run_all(evaluate='energy', mols=[m1, m2], parallel=True)
+    assert len(calls) == 2
@@ -42,3 +42,19 @@ def test_fetch_ecp():
     ibas = ecpbas['elements']['53']
     assert 'ecp_potentials' in ibas
     assert 'electron_shells' not in ibas
+
+
+def test_internal_basis_converter():
+    bsew._converter_cache.clear()
+    basis = shell_data.get_vdz_internal()
+    g94 = bsew.internal_basis_converter(basis, fmt='gaussian94')
+    assert len(bsew._converter_cache) == 1
+    assert bsew.internal_basis_converter(shell_data.get_vdz_internal(), fmt='gaussian94') == g94
+    assert len(bsew._converter_cache) == 1
+
+    basis['h'][0].exps[0] = 20.0
+    new_g94 = bsew.internal_basis_converter(basis, fmt='gaussian94')
+    assert new_g94 != g94
+    assert '2.000000e+01' in new_g94.lower().replace('d', 'e')
+    bsew.internal_basis_converter(basis, fmt='nwchem')
+    assert len(bsew._converter_cache) == 3
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import basisopt.containers as boc
@@ -20,6 +21,17 @@ def test_shell_compute():
             value = s.compute(*c)
             assert almost_equal(value, v[ix], thresh=1e-10)
 
+        coords = np.array([c for c, _ in shell_data._compute_values])
+        values = s.compute(coords[:, 0], coords[:, 1], coords[:, 2])
+        for value, (_, v) in zip(values, shell_data._compute_values):
+            assert almost_equal(value, v[ix], thresh=1e-10)
+
+    coords = np.array([c for c, _ in shell_data._compute_values])
+    values = boc.Shell.compute_batch(hbas['h'], coords[:, 0], coords[:, 1], coords[:, 2])
+    assert values.shape == (len(hbas['h']), len(coords))
+    expected = np.array([v for _, v in shell_data._compute_values]).T
+    assert np.allclose(values, expected, rtol=0.0, atol=1e-10)
+
 
 def test_basis_dict():
     hbas = shell_data.get_vdz_internal()
@@ -115,6 +127,21 @@ def test_search_result():
     assert "Flump" not in results.values()
 
 
+def test_search_deep_result():
+    root = boc.Result(name="Root")
+    node = root
+    for i in range(2000):
+        child = boc.Result(name=f"Level{i}")
+        child.add_data("Level", i)
+        node.add_child(child)
+        node = child
+    assert node.depth == 2001
+
+    results = root.search("Level")
+    assert len(results) == 2000
+    assert list(results.values()) == list(range(2000))
+
+
 def test_load_result():
     r = boc.Result().load("tests/data/result_test.bin")
     assert r.name == 'Parent'
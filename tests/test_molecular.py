@@ -0,0 +1,36 @@
+from basisopt import api, parallelise
+from basisopt.basis.molecular import MolecularBasis
+from basisopt.molecule import Molecule
+from basisopt.testing import PropertyTest
+from tests.data.shells import get_vdz_internal
+from tests.data.utils import serial_distribute
+
+
+def _make_basis() -> MolecularBasis:
+    h2 = Molecule("H2")
+    h2.method = "linear"
+    h2.add_atom(element="H", coord=[0.0, 0.0, 0.0])
+    h2.add_atom(element="H", coord=[0.0, 0.0, 0.7])
+    mb = MolecularBasis(name="test", molecules=[h2])
+    mb.basis = get_vdz_internal()
+    mb.register_test(PropertyTest("energy", prop="energy"))
+    mb.register_test(PropertyTest("dipole", prop="dipole"))
+    return mb
+
+
+def test_run_all_tests_parallel(monkeypatch):
+    api.set_backend("dummy")
+    monkeypatch.setattr(api, "_PARALLEL", True)
+    monkeypatch.setattr(parallelise, "distribute", serial_distribute)
+
+    serial = _make_basis()
+    serial.run_all_tests(reference_basis=get_vdz_internal())
+    parallel = _make_basis()
+    parallel.run_all_tests(reference_basis=get_vdz_internal(), parallel=True)
+
+    for t in serial._tests:
+        expected = serial.results.get_child(t.name)
+        child = parallel.results.get_child(t.name)
+        assert child.get_data("H2") == expected.get_data("H2")
+        assert child.get_data("H2_ref") == expected.get_data("H2_ref")
+        assert parallel.get_test(t.name).result == t.result
@@ -1,7 +1,12 @@
+import copy
+import os
+
+import numpy as np
 import pytest
 
 from basisopt.exceptions import InvalidDiatomic
 from basisopt.molecule import Molecule, build_diatomic
+from tests.data.shells import get_vdz_internal
 from tests.data.utils import almost_equal
 
 
@@ -36,6 +41,19 @@ def test_add_atom():
     assert almost_equal(m.distance(0, 1), 1.5)
 
 
+def test_add_atoms_bulk():
+    m = Molecule()
+    m.add_atom()
+    m.add_atoms_bulk(['O', 'H'], np.array([[1.5, 0.0, 0.0], [0.0, 2.0, 0.0]]))
+    assert m.natoms() == 3
+    assert m._atom_names == ['H', 'O', 'H']
+    assert almost_equal(m.distance(0, 1), 1.5)
+    assert almost_equal(m.distance(0, 2), 2.0)
+
+    with pytest.raises(ValueError):
+        m.add_atoms_bulk(['O'], np.zeros((2, 3)))
+
+
 def test_add_get_result():
     m = Molecule()
     m.add_result("energy", -0.5)
@@ -86,6 +104,22 @@ def test_from_xyz():
     assert m.get_line(-3) == line1
 
 
+def test_from_xyz_cache(tmp_path):
+    filename = tmp_path / "h2.xyz"
+    filename.write_text("2\nH2\nH 0.0 0.0 0.0\nH 0.0 0.0 0.7\n")
+    m = Molecule.from_xyz(str(filename))
+    assert m.natoms() == 2
+
+    # the same file is shared between molecules without being aliased
+    m._coords[1][2] = 1.0
+    assert almost_equal(Molecule.from_xyz(str(filename)).distance(0, 1), 0.7)
+
+    # an edited file is read again
+    filename.write_text("1\nH\nH 0.0 0.0 0.0\n")
+    os.utime(filename, ns=(0, 10**9))
+    assert Molecule.from_xyz(str(filename)).natoms() == 1
+
+
 def test_set_dummy_atoms():
     m = Molecule()
     m.set_dummy_atoms([1, 2, 3])
@@ -100,6 +134,16 @@ def test_set_dummy_atoms():
     assert len(m.dummy_atoms) == 2
 
 
+def test_get_lines():
+    m = Molecule.from_xyz("tests/data/caffeine.xyz")
+    m.set_dummy_atoms([0, 2])
+    lines = m.get_lines(dummy_prefix="@", dummy_suffix=":")
+    assert len(lines) == m.natoms()
+    assert lines[0] == m.get_line(0, atom_prefix="@", atom_suffix=":")
+    assert lines[1] == m.get_line(1)
+    assert lines[2].startswith("@")
+
+
 def test_set_ecps():
     m = Molecule.from_xyz("tests/data/caffeine.xyz")
     m.set_ecps({'O': 'SBKJC-ECP', 'I': 'def2-QZVP'})
@@ -135,8 +179,29 @@ def test_build_diatomic():
     with pytest.raises(IndexError):
         _ = build_diatomic("H2")
 
+
+@pytest.mark.parametrize("mol_str", ["H2O,1.4", "Ne,1.4", "C5,1.4", "CHCl3,1.4"])
+def test_build_diatomic_invalid(mol_str):
     with pytest.raises(InvalidDiatomic):
-        _ = build_diatomic("H2O,1.4")
-        _ = build_diatomic("Ne,1.4")
-        _ = build_diatomic("C5,1.4")
-        _ = build_diatomic("CHCl3,1.4")
+        _ = build_diatomic(mol_str)
+
+
+def test_deepcopy():
+    m = Molecule()
+    m.add_atom(element='H', coord=[0.0, 0.0, 0.0])
+    m.basis = get_vdz_internal()
+    m.add_result('energy', -0.5)
+    c = copy.deepcopy(m)
+    assert c._coords is not m._coords
+    assert c._coords[0] is not m._coords[0]
+    assert c.basis['h'][0] is not m.basis['h'][0]
+    assert np.allclose(c.basis['h'][0].exps, m.basis['h'][0].exps)
+
+    c.add_atom(element='H', coord=[0.0, 0.0, 1.0])
+    c._coords[0][2] = 2.0
+    c.basis['h'][0].exps[0] = 1.0
+    c.add_result('energy', -1.0)
+    assert m.natoms() == 1
+    assert m._coords[0][2] == 0.0
+    assert m.basis['h'][0].exps[0] != 1.0
+    assert m.get_result('energy') == -0.5
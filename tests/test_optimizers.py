@@ -0,0 +1,21 @@
+import numpy as np
+
+from basisopt.opt import optimizers
+
+
+def test_last_evaluation():
+    calls = []
+
+    def _objective(x):
+        calls.append(x.copy())
+        return float(np.sum(x**2))
+
+    objective = optimizers._last_evaluation(_objective)
+    x = np.array([1.0, 2.0])
+    assert objective(x) == 5.0
+    assert objective(x.copy()) == 5.0
+    assert len(calls) == 1
+
+    assert objective(np.array([1.0, 3.0])) == 10.0
+    assert objective(x) == 5.0
+    assert len(calls) == 3
@@ -0,0 +1,48 @@
+import pickle
+
+from basisopt import optrecord
+from basisopt.containers import Result
+from tests.data.shells import get_vdz_internal
+
+
+def _record() -> optrecord.OptRecord:
+    record = optrecord.OptRecord(name="H2")
+    record.species = ['H', 'H']
+    child = Result(name="H")
+    for shell in get_vdz_internal()['h']:
+        child.add_data(shell.l, shell)
+    record.add_child(child)
+    return record
+
+
+def test_get_basis_cache(monkeypatch):
+    calls = []
+
+    def _fetch_basis(name, elements):
+        calls.append(name)
+        return {}
+
+    monkeypatch.setattr(optrecord, "fetch_basis", _fetch_basis)
+    record = _record()
+    basis = record.get_basis(ls=['s', 'p'])
+    assert len(calls) == 1
+
+    # modifying the returned basis leaves the memoized one alone
+    basis['h'][0].exps[0] = 1.0e6
+    basis['he'] = []
+    basis = record.get_basis(ls=['s', 'p'])
+    assert len(calls) == 1
+    assert 'he' not in basis
+    assert basis['h'][0].exps[0] != 1.0e6
+
+    # new data in a child is picked up
+    new_shell = basis['h'][0]
+    new_shell.exps[0] = 42.0
+    record.get_child("H").add_data('s', new_shell)
+    assert record.get_basis(ls=['s', 'p'])['h'][0].exps[0] == 42.0
+    assert len(calls) == 2
+
+    # records pickled before memoization was added have no cache
+    del record._basis_cache
+    record = pickle.loads(pickle.dumps(record))
+    assert record.get_basis(ls=['s', 'p'])['h'][0].exps[0] == 42.0
@@ -0,0 +1,91 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from basisopt.exceptions import MethodNotAvailable
+from basisopt.wrappers.orca import OrcaWrapper
+from tests.data.shells import h_atom
+
+_PROPERTY_FILE = "tests/data/orca_property.txt"
+_ENERGY = "Calculation_Info:Total Energy"
+_DIPOLE = "SCF_Electric_Properties:Total Dipole moment"
+_QUADRUPOLE = "SCF_Electric_Properties:Total quadrupole moment"
+_POLARIZABILITY = "SCF_Electric_Properties:Isotropic polarizability"
+
+
+def _fake_orca(monkeypatch, wrapper):
+    """Replaces running ORCA with copying in the test property file, and
+    returns a list that gets the text of each input file
+    """
+    inputs = []
+
+    def _run_orca(prefix, program="orca"):
+        with open(f"{prefix}.inp") as f:
+            inputs.append(f.read())
+        shutil.copy(_PROPERTY_FILE, f"{prefix}_property.txt")
+
+    monkeypatch.setattr(wrapper, "_run_orca", _run_orca)
+    return inputs
+
+
+def _hf_atom():
+    m = h_atom()
+    m.method = "hf"
+    return m
+
+
+def test_parse_property_lines():
+    wrapper = OrcaWrapper("")
+    with open(_PROPERTY_FILE) as f:
+        lines = f.readlines()
+    search_strings = [_ENERGY, _DIPOLE, _QUADRUPOLE, _POLARIZABILITY, "SCF_Energy:SCF Energy"]
+    results = wrapper._parse_property_lines(lines, search_strings + ["SCF_Energy:Missing"])
+    assert float(results[_ENERGY]) == -0.4982329134
+    assert float(results["SCF_Energy:SCF Energy"]) == -0.4982329134
+    assert np.array_equal(results[_DIPOLE], [0.0, 0.0, 0.3])
+    assert np.array_equal(results[_QUADRUPOLE], np.diag([-1.5, -1.5, 3.0]))
+    assert results[_POLARIZABILITY] == "4.493917"
+    assert results["SCF_Energy:Missing"] is None
+
+
+def test_properties(monkeypatch, tmp_path):
+    wrapper = OrcaWrapper("")
+    inputs = _fake_orca(monkeypatch, wrapper)
+    values = wrapper.properties(
+        _hf_atom(), ['energy', 'dipole', 'polarizability'], tmp=str(tmp_path)
+    )
+    assert len(inputs) == 1
+    assert "dipole\ttrue" in inputs[0] and "polar\ttrue" in inputs[0]
+    assert "quadrupole" not in inputs[0]
+    assert values['energy'] == -0.4982329134
+    assert np.array_equal(values['dipole'], [0.0, 0.0, 0.3])
+    assert values['polarizability'] == "4.493917"
+    assert os.listdir(tmp_path) == []
+
+    mol = _hf_atom()
+    mol.method = "mp2"
+    with pytest.raises(MethodNotAvailable):
+        wrapper.properties(mol, ['dipole', 'polarizability'], tmp=str(tmp_path))
+    assert len(inputs) == 1
+
+
+def test_run_many(monkeypatch, tmp_path):
+    wrapper = OrcaWrapper("")
+    inputs = _fake_orca(monkeypatch, wrapper)
+    mol = _hf_atom()
+    assert wrapper.run_many(['energy', 'dipole', 'quadrupole'], mol, {}, tmp=str(tmp_path)) == 0
+    assert len(inputs) == 1
+    assert wrapper.get_value('energy') == -0.4982329134
+    assert np.array_equal(wrapper.get_value('dipole'), [0.0, 0.0, 0.3])
+    assert np.array_equal(wrapper.get_value('quadrupole'), np.diag([-1.5, -1.5, 3.0]))
+
+    # energies alone, or anything that is not an electric property, run one at a time
+    assert wrapper.run_many(['energy'], mol, {}, tmp=str(tmp_path)) == 0
+    assert len(inputs) == 2
+    assert "%elprop" not in inputs[1]
+
+    mol.method = "mp2"
+    assert wrapper.run_many(['dipole', 'polarizability'], mol, {}, tmp=str(tmp_path)) == -1
+    assert len(inputs) == 2
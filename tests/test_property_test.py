@@ -0,0 +1,52 @@
+import pickle
+
+from basisopt import api
+from basisopt.molecule import Molecule
+from basisopt.testing import PropertyTest
+from tests.data.shells import get_vdz_internal
+
+
+def test_calculate_cache(monkeypatch):
+    api.set_backend("dummy")
+    calls = []
+    run_calculation = api.run_calculation
+
+    def _count(**kwargs):
+        calls.append(kwargs)
+        return run_calculation(**kwargs)
+
+    monkeypatch.setattr(api, "run_calculation", _count)
+    mol = Molecule("H")
+    mol.add_atom()
+    basis = get_vdz_internal()
+
+    test = PropertyTest("H", mol=mol)
+    test.calculate("linear", basis)
+    test.calculate("linear", basis)
+    assert len(calls) == 2
+
+    test = PropertyTest("H", mol=mol, cache_size=1)
+    value = test.calculate("linear", basis)
+    assert test.calculate("linear", basis) == value
+    assert len(calls) == 3
+    test.calculate("quadratic", basis)
+    test.calculate("linear", basis)
+    assert len(calls) == 5
+    assert len(test._cache) == 1
+
+    new_test = PropertyTest.from_dict(test.as_dict())
+    assert new_test.cache_size == 1
+
+
+def test_load_baseline_pickle():
+    # pickled before caching was added to PropertyTest
+    api.set_backend("dummy")
+    with open("tests/data/property_test_baseline.bin", "rb") as f:
+        test = pickle.load(f)
+    assert test.name == "H_energy"
+    assert test.reference == -0.5
+    assert test.eval_type == "energy"
+    assert test.molecule.natoms() == 1
+
+    assert test.cache_size == 0
+    assert test.calculate("linear", get_vdz_internal()) == test.get_data("H_energy_energy")
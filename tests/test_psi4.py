@@ -0,0 +1,39 @@
+import importlib
+import sys
+from unittest import mock
+
+from basisopt.molecule import Molecule
+from tests.data.shells import get_vdz_internal
+
+
+def _wrapper(monkeypatch):
+    psi4 = mock.MagicMock()
+    psi4.energy.return_value = -0.5
+    monkeypatch.setitem(sys.modules, "psi4", psi4)
+    monkeypatch.delitem(sys.modules, "basisopt.wrappers.psi4", raising=False)
+    module = importlib.import_module("basisopt.wrappers.psi4")
+    return module.Psi4Wrapper(), psi4
+
+
+def test_initialise_sets_state_every_run(monkeypatch):
+    wrapper, psi4 = _wrapper(monkeypatch)
+    wrapper.add_global("memory", "1 GB")
+    mol = Molecule("H")
+    mol.method = "scf"
+    mol.add_atom(element="H", coord=[0.0, 0.0, 0.0])
+    mol.multiplicity = 2
+    mol.basis = get_vdz_internal()
+
+    for _ in range(2):
+        assert wrapper.run("energy", mol, {"reference": "uhf"}) == 0
+    assert wrapper.get_value("energy") == -0.5
+
+    # Psi4 options, memory and basis are global state that anything else may
+    # change between runs, so they are passed on for every calculation
+    assert psi4.set_memory.call_count == 2
+    assert psi4.basis_helper.call_count == 2
+    assert psi4.set_options.call_args_list == [mock.call({"reference": "uhf"})] * 2
+
+    # each run gets its own geometry
+    assert psi4.geometry.call_count == 2
+    psi4.geometry.return_value.set_multiplicity.assert_called_with(2)
@@ -0,0 +1,121 @@
+import numpy as np
+
+from basisopt import api
+from basisopt.basis.atomic import AtomicBasis
+from basisopt.testing import rank
+from tests.data.shells import get_vdz_internal, h_atom
+from tests.data.utils import almost_equal, count_energy_calls
+
+
+def test_evaluate_uses_result_cache(monkeypatch):
+    calls = count_energy_calls(monkeypatch)
+    m = h_atom()
+    value = rank._evaluate(m, "energy", {})
+    assert rank._evaluate(m, "energy", {}) == value
+    assert len(calls) == 2
+
+    api.set_result_cache(4)
+    rank._evaluate(m, "energy", {})
+    assert rank._evaluate_all([m], "energy", {}) == [value]
+    assert len(calls) == 3
+
+
+def test_errors():
+    assert almost_equal(rank._errors(-1.5, -1.0), 0.5, thresh=1e-12)
+    assert almost_equal(rank._errors(np.array([3.0, 4.0, 1.0]), np.array([0, 0, 1.0])), 5.0)
+    errs = rank._errors([[3.0, 4.0], [1.0, 0.0]], np.zeros(2), batched=True)
+    assert np.allclose(errs, [5.0, 1.0])
+    assert np.allclose(rank._errors([1.0, -2.0], 0.5, batched=True), [0.5, 2.5])
+
+
+def test_leave_one_out_exps():
+    exps = np.array([4.0, 3.0, 2.0, 1.0])
+    candidates = rank._leave_one_out_exps(exps)
+    assert candidates.shape == (4, 3)
+    for i in range(4):
+        assert np.array_equal(candidates[i], np.delete(exps, i))
+    assert rank._leave_one_out_exps(np.array([1.0])).shape == (1, 0)
+
+
+def test_trial_molecule():
+    m = h_atom()
+    exps = m.basis['h'][0].exps.copy()
+    trial = rank._trial_molecule(m, 'basis', 'h', 0, exps[1:], "trial")
+    assert trial.name == "trial"
+    assert len(trial.basis['h'][0].exps) == 3
+    assert len(trial.basis['h'][0].coefs) == 3
+    assert trial.basis['h'][1] is m.basis['h'][1]
+    assert len(m.basis['h'][0].exps) == 4
+    assert len(m.basis['h'][0].coefs) == 2
+
+
+def _exp_sum(mol, eval_type, params):
+    return sum(np.sum(s.exps) for s in mol.basis['h'])
+
+
+def test_rank_primitives_screened(monkeypatch):
+    monkeypatch.setattr(rank, "_evaluate", _exp_sum)
+    atomic = AtomicBasis('H')
+    atomic._molecule.basis = get_vdz_internal()
+
+    shell = atomic._molecule.basis['h'][0]
+    exps, coefs = shell.exps, shell.coefs
+    errors, ranks = rank.rank_primitives(atomic, shells=[0])
+    assert shell.exps is exps and shell.coefs is coefs
+    assert np.allclose(errors[0], [13.01, 1.962, 0.4446, 0.122])
+    assert list(ranks[0]) == [3, 2, 1, 0]
+
+    errors, ranks = rank.rank_primitives_screened(atomic, thresh=1.0, shells=[0])
+    assert np.allclose(errors[0][2:], [0.4446, 0.122])
+    assert abs(errors[0][1] - 1.962) < 1e-10
+    assert np.isinf(errors[0][0])
+    assert list(ranks[0]) == [3, 2, 1, 0]
+    assert len(atomic._molecule.basis['h'][0].exps) == 4
+
+
+def test_rank_primitives_parallel(monkeypatch):
+    def _exp_sum_all(mols, eval_type, params, parallel=False):
+        return [_exp_sum(m, eval_type, params) for m in mols]
+
+    monkeypatch.setattr(rank, "_evaluate", _exp_sum)
+    monkeypatch.setattr(rank, "_evaluate_all", _exp_sum_all)
+    atomic = AtomicBasis('H')
+    atomic._molecule.basis = get_vdz_internal()
+
+    errors, ranks = rank.rank_primitives(atomic, shells=[0, 1])
+    p_errors, p_ranks = rank.rank_primitives(atomic, shells=[0, 1], parallel=True)
+    for e, r, pe, pr in zip(errors, ranks, p_errors, p_ranks):
+        assert np.allclose(e, pe)
+        assert list(r) == list(pr)
+
+
+def test_split_errors():
+    all_err = np.array([[0.3, 0.1, np.inf, 0.2], [0.5, np.inf, np.inf, np.inf]])
+    errors, ranks = rank._split_errors(all_err, [4, 1])
+    assert len(errors[0]) == 4
+    assert list(ranks[0]) == [1, 3, 0, 2]
+    assert len(errors[1]) == 1
+    assert list(ranks[1]) == [0]
+
+
+def test_find_cutoff():
+    errors = np.array([1e-3, 1e-6, 1e-5, 1e-2])
+    ranks = np.argsort(errors)
+    assert rank._find_cutoff(errors, ranks, 1e-4) == 2
+    assert rank._find_cutoff(errors, ranks, 5e-3) == 3
+    assert rank._find_cutoff(errors, ranks, 1.0) == 4
+    assert rank._find_cutoff(errors, ranks, 1e-7) == 0
+
+
+def test_reduce_primitives(monkeypatch):
+    monkeypatch.setattr(rank, "_evaluate", _exp_sum)
+    atomic = AtomicBasis('H')
+    atomic._molecule.basis = get_vdz_internal()
+
+    basis, delta = rank.reduce_primitives(atomic, thresh=1.0)
+    assert np.allclose(basis['h'][0].exps, [1.962, 13.01])
+    assert len(basis['h'][0].coefs) == 2
+    assert basis['h'][1].exps.size == 0
+    assert almost_equal(delta, 1.962 + 13.01 - 16.2656, thresh=1e-10)
+    assert len(atomic._molecule.basis['h'][0].exps) == 4
+    assert atomic._molecule.basis['h'][1].exps.size == 1
@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from basisopt.data import get_even_temper_params
-from basisopt.util import fit_poly, read_json
+from basisopt.util import _taylor_shift, fit_poly, fit_poly_batch, read_json, write_json
 
 
 def test_read_json():
@@ -13,15 +14,54 @@ def test_read_json():
     assert type(shell.exps).__name__ == 'ndarray'
 
 
+def test_write_json_fast(tmp_path):
+    obj = read_json('tests/data/neon.json')
+    filename = str(tmp_path / "neon.json")
+    write_json(filename, obj, fast=True)
+    new_obj = read_json(filename)
+    assert type(new_obj).__name__ == 'AtomicBasis'
+    for old, new in zip(obj.get_basis()['ne'], new_obj.get_basis()['ne']):
+        assert type(new.exps).__name__ == 'ndarray'
+        assert np.array_equal(old.exps, new.exps)
+        assert all(np.array_equal(c1, c2) for c1, c2 in zip(old.coefs, new.coefs))
+
+
 def test_fit_poly():
     data = pd.read_csv('tests/data/cl2.csv')
-    _, xref, re, pt = fit_poly(data['R'], data['ECC'], n=6)
+    p, xref, re, pt = fit_poly(data['R'], data['ECC'], n=6)
+    assert isinstance(p, np.poly1d)
+    assert abs(p(re - xref) - pt[0]) < 1e-8
+    assert abs(p.deriv()(re - xref)) < 1e-8
     assert abs(xref - 2.00749686) < 1e-8
     assert abs(re - 1.98792829) < 1e-8
     assert len(pt) == 7
     assert abs(pt[0] + 919.45844231) < 1e-8
 
 
+def test_fit_poly_batch():
+    data = pd.read_csv('tests/data/cl2.csv')
+    x = np.array([data['R'], data['R'] + 0.5])
+    y = np.array([data['ECC'], data['ECC'] + 1.0])
+    z, xref, re, pt = fit_poly_batch(x, y, n=6)
+    assert z.shape == (2, 7)
+    assert pt.shape == (2, 7)
+    assert np.allclose(xref, [2.00749686, 2.50749686])
+    assert np.allclose(re, [1.98792829, 2.48792829])
+    assert np.allclose(pt[0, 1:], pt[1, 1:])
+    assert abs(pt[1, 0] - pt[0, 0] - 1.0) < 1e-8
+
+    _, xref, re, pt = fit_poly_batch(np.linspace(0, 1, 5), np.linspace(0, 1, 5), n=2)
+    assert re[0] == xref[0] == 0.0
+    assert np.all(pt == 0.0)
+
+
+def test_taylor_shift():
+    # p(x) = 1 + 2x + 3x^2, so p(x + 1) = 6 + 8x + 3x^2
+    c = np.array([[1.0, 2.0, 3.0], [1.0, 2.0, 3.0]])
+    b = _taylor_shift(c, np.array([1.0, 0.0]))
+    assert np.allclose(b, [[6.0, 8.0, 3.0], [1.0, 2.0, 3.0]])
+
+
 def test_get_even_temper():
     # even_tempered_data is currently empty
     result = get_even_temper_params()
@@ -28,7 +28,7 @@ def test_add_global():
 def test_get_value():
     w = Wrapper()
     assert w.get_value("energy") is None
-    w._values['energy'] = 1
+    w.set_value('energy', 1)
     assert w.get_value("energy") == 1
 
 
@@ -64,6 +64,19 @@ def test_run():
     assert dw.run("quadrupole", m, {}) == -1
 
 
+def test_run_many():
+    m = Molecule.from_xyz("tests/data/caffeine.xyz")  # 24 atoms
+
+    dw = DummyWrapper()
+    m.method = "linear"
+    assert dw.run_many(["energy", "dipole"], m, {}) == 0
+    assert almost_equal(dw.get_value("energy"), -24)
+    assert almost_equal(dw.get_value("dipole"), 12)
+
+    m.method = "exp"
+    assert dw.run_many(["dipole", "quadrupole"], m, {}) == -1
+
+
 def test_method_is_available():
     w = Wrapper()
     assert not w.method_is_available()